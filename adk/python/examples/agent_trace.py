@@ -1,100 +1,226 @@
 # trace_mcp_server.py
 import asyncio
+import difflib
 import json
-import uuid
-import httpx
 import os
-import subprocess
+import sys
+import time
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
+from weil_ai.http import close_shared_http_clients, shared_http_client
+from weil_ai.keys import locate_key
 from weil_wallet import PrivateKey, Wallet, WeilClient
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 server = Server("agent-trace")
 
+# Trace records waiting to be audited on-chain. post_trace() only enqueues,
+# so a Write returns without waiting on the chain; _flusher() drains the
+# queue in batches so a burst of Writes costs one round of concurrent audits
+# instead of one RTT per record. The queue is bounded: once _QUEUE_SIZE
+# records are pending, post_trace() waits for room (backpressure).
+_BATCH_SIZE = 64
+_QUEUE_SIZE = 256
+_trace_queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+
 
 def _make_client() -> WeilClient:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    for candidate in (
-        os.path.join(script_dir, "private_key.wc"),
-        "private_key.wc",
-        os.path.join(os.path.dirname(script_dir), "private_key.wc"),
-    ):
-        if os.path.isfile(candidate):
-            pk = PrivateKey.from_file(candidate)
-            wallet = Wallet(pk)
-            return WeilClient(wallet)
-    raise FileNotFoundError(
-        "private_key.wc not found. Place it in examples/, python/, or cwd."
-    )
+    pk = PrivateKey.from_file(locate_key(os.path.dirname(os.path.abspath(__file__))))
+    return WeilClient(Wallet(pk), http_client=shared_http_client())
 
 
 client = _make_client()
 
 
-def get_git_head() -> str:
-    result = subprocess.run(
-        ["git", "rev-parse", "HEAD"], capture_output=True, text=True
-    )
-    return result.stdout.strip()
-
+# HEAD and the repo root are read straight from .git instead of spawning
+# `git rev-parse`; the subprocess is only a fallback for layouts the readers
+# below don't handle. The repo root never changes for the life of the
+# process; HEAD is re-read after _GIT_HEAD_TTL seconds so traces written
+# after a commit record the new revision.
+_GIT_HEAD_TTL = 5.0
+_GIT_ROOT: Path | None = None
+_GIT_HEAD: str | None = None
+_GIT_HEAD_EXPIRES = 0.0
 
-def get_git_root() -> Path:
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True
-    )
-    return Path(result.stdout.strip())
 
+def _rev_parse(*args: str) -> str:
+    import subprocess
 
-def compute_ranges(old_content: str, new_content: str) -> list[dict]:
-    """Diff old vs new and return added line ranges."""
-    old_lines = old_content.splitlines(keepends=True)
-    new_lines = new_content.splitlines(keepends=True)
+    result = subprocess.run(["git", "rev-parse", *args], capture_output=True, text=True)
+    return result.stdout.strip()
 
-    ranges = []
-    current_line = 1
-    i_old = 0
-    i_new = 0
 
-    import difflib
+def _git_dir(root: Path) -> Path:
+    dot_git = root / ".git"
+    if dot_git.is_file():
+        # Worktrees and submodules: .git is a "gitdir: <path>" pointer file.
+        gitdir = dot_git.read_text().strip().removeprefix("gitdir: ")
+        return (root / gitdir).resolve()
+    return dot_git
+
+
+def _read_head(root: Path) -> str | None:
+    git_dir = _git_dir(root)
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head  # detached HEAD: the hash is inline
+    ref = head[5:]
+    try:
+        return (git_dir / ref).read_text().strip()
+    except OSError:
+        pass
+    try:
+        packed = (git_dir / "packed-refs").read_text()
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
 
-    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
 
-    for op, old_start, old_end, new_start, new_end in matcher.get_opcodes():
-        added_count = new_end - new_start
-        removed_count = old_end - old_start
+def get_git_head() -> str:
+    global _GIT_HEAD, _GIT_HEAD_EXPIRES
+    now = time.monotonic()
+    if _GIT_HEAD is None or now >= _GIT_HEAD_EXPIRES:
+        _GIT_HEAD = _read_head(get_git_root()) or _rev_parse("HEAD")
+        _GIT_HEAD_EXPIRES = now + _GIT_HEAD_TTL
+    return _GIT_HEAD
 
-        if op == "equal":
-            current_line += added_count
-        elif op == "insert":
-            ranges.append(
-                {"start_line": current_line, "end_line": current_line + added_count - 1}
-            )
-            current_line += added_count
-        elif op == "replace":
-            ranges.append(
-                {"start_line": current_line, "end_line": current_line + added_count - 1}
-            )
-            current_line += added_count
-        elif op == "delete":
-            pass  # removed lines don't affect new file line numbers
 
-    return ranges
+def get_git_root() -> Path:
+    global _GIT_ROOT
+    if _GIT_ROOT is None:
+        cwd = Path.cwd()
+        for candidate in (cwd, *cwd.parents):
+            if (candidate / ".git").exists():
+                _GIT_ROOT = candidate
+                break
+        else:
+            _GIT_ROOT = Path(_rev_parse("--show-toplevel"))
+    return _GIT_ROOT
+
+
+# Resolved once at startup so build_trace_record() can relativise paths with
+# a prefix strip instead of a subprocess + Path.relative_to() per Write.
+_GIT_ROOT_STR = str(get_git_root()) + os.sep
+
+
+def compute_ranges(old_content: bytes, new_content: bytes) -> list[int]:
+    """Diff old vs new and return added line ranges.
+
+    Ranges are flattened as ``[start1, end1, start2, end2, ...]`` (1-based,
+    inclusive) to keep the trace payload small.
+    """
+    # Work on raw bytes (line numbers don't depend on the encoding) and hash
+    # each line once so the matcher compares small ints; autojunk is off
+    # because its popularity heuristic mis-diffs repetitive source files.
+    old_lines = [hash(line) for line in old_content.splitlines()]
+    new_lines = [hash(line) for line in new_content.splitlines()]
+
+    matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+
+    # Only inserted/replaced lines exist in the new file; new_start is
+    # already the 0-based line offset, so no running counter is needed.
+    return [
+        line
+        for op, _, _, new_start, new_end in matcher.get_opcodes()
+        if op == "insert" or op == "replace"
+        for line in (new_start + 1, new_end)
+    ]
+
+
+def _json_default(obj: object) -> str:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dump_trace(trace_record: dict) -> str:
+    """Serialize a trace record as compact JSON with raw (unescaped) UTF-8.
+
+    orjson encodes datetime and UUID natively; the json fallback uses the same
+    separators, ``ensure_ascii=False`` and ``isoformat()``/``str()`` for those
+    types, so the record is byte-identical whether or not orjson is installed.
+    This differs from plain ``json.dumps`` output (no spaces after
+    separators, no ``\\uXXXX`` escapes).
+    """
+    if orjson is not None:
+        return orjson.dumps(trace_record).decode()
+    return json.dumps(
+        trace_record, default=_json_default, separators=(",", ":"), ensure_ascii=False
+    )
 
 
 async def post_trace(trace_record: dict):
-    await client.audit(json.dumps(trace_record))
+    try:
+        _trace_queue.put_nowait(trace_record)
+    except asyncio.QueueFull:
+        await _trace_queue.put(trace_record)
 
 
-def build_trace_record(file_path: str, ranges: list[dict]) -> dict:
-    git_root = get_git_root()
-    relative_path = str(Path(file_path).relative_to(git_root))
+async def _flush_batch(batch: list[dict]) -> None:
+    results = await asyncio.gather(
+        *(client.audit(dump_trace(record)) for record in batch),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"[agent-trace] Failed to submit trace: {result}", file=sys.stderr)
+
+
+async def _flusher() -> None:
+    """Submit queued trace records, up to _BATCH_SIZE at a time."""
+    while True:
+        batch = [await _trace_queue.get()]
+        while len(batch) < _BATCH_SIZE:
+            try:
+                batch.append(_trace_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        # A bad batch (e.g. a record that fails to serialize) must not kill
+        # the flusher, or every later trace would sit in the queue forever.
+        try:
+            await _flush_batch(batch)
+        except Exception as exc:
+            print(f"[agent-trace] Failed to flush trace batch: {exc}", file=sys.stderr)
+        finally:
+            for _ in batch:
+                _trace_queue.task_done()
+
+
+async def drain_and_stop(flusher: asyncio.Task) -> None:
+    """Wait for all queued traces to be submitted, then stop the flusher."""
+    await _trace_queue.join()
+    flusher.cancel()
+    try:
+        await flusher
+    except asyncio.CancelledError:
+        pass
+
+
+def build_trace_record(file_path: Path, ranges: list[int]) -> dict:
+    abs_path = os.path.abspath(file_path)
+    if abs_path.startswith(_GIT_ROOT_STR):
+        relative_path = abs_path[len(_GIT_ROOT_STR) :]
+    else:
+        relative_path = abs_path
 
     return {
         "version": "0.1.0",
-        "id": str(uuid.uuid4()),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "id": uuid.uuid4(),
+        "timestamp": datetime.now(timezone.utc),
         "vcs": {"type": "git", "revision": get_git_head()},
         "tool": {"name": "claude-code", "version": "1.0"},
         "files": [
@@ -106,6 +232,7 @@ def build_trace_record(file_path: str, ranges: list[dict]) -> dict:
                             "type": "ai",
                             "model_id": "anthropic/claude-sonnet-4-6",
                         },
+                        "ranges_format": "flat_pairs",
                         "ranges": ranges,
                     }
                 ],
@@ -117,44 +244,84 @@ def build_trace_record(file_path: str, ranges: list[dict]) -> dict:
 # --- MCP Tool: intercept Write ---
 
 
-@server.call_tool()
-async def handle_tool(name: str, arguments: dict) -> list:
-    if name == "Write":
-        file_path = arguments["file_path"]
-        new_content = arguments["content"]
-
-        # Snapshot old content
-        try:
-            old_content = Path(file_path).read_text(encoding="utf-8")
-        except FileNotFoundError:
-            old_content = ""
-
-        # Write the file
-        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-        Path(file_path).write_text(new_content, encoding="utf-8")
-
-        # Compute ranges and post trace
+def _write_file(path: Path, data: bytes) -> None:
+    """Write data straight to the file descriptor, without a buffered writer.
+
+    No fsync: the trace goes to the chain, local durability is up to the OS.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+async def _handle_write(name: str, arguments: dict) -> list:
+    file_path = arguments["file_path"]
+    path = Path(file_path)
+    new_content = arguments["content"].encode("utf-8")
+
+    # Snapshot old content
+    try:
+        old_content = path.read_bytes()
+    except FileNotFoundError:
+        old_content = b""
+
+    # Write the file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_file(path, new_content)
+
+    # Compute ranges and post trace. New files are all insertions and
+    # unchanged files have none, so neither needs a diff.
+    if old_content == new_content:
+        ranges = []
+    elif not old_content:
+        # Same line rule as compute_ranges (bytes.splitlines: \n, \r\n, \r).
+        ranges = [1, len(new_content.splitlines())]
+    else:
         ranges = compute_ranges(old_content, new_content)
 
-        if ranges:
-            trace = build_trace_record(file_path, ranges)
-            await post_trace(trace)
-            print(f"[agent-trace] Recorded {len(ranges)} range(s) for {file_path}")
+    if ranges:
+        trace = build_trace_record(path, ranges)
+        await post_trace(trace)
+        print(
+            f"[agent-trace] Recorded {len(ranges) // 2} range(s) for {file_path}",
+            file=sys.stderr,
+        )
+
+    return [{"type": "text", "text": f"Written: {file_path}"}]
 
-        return [{"type": "text", "text": f"Written: {file_path}"}]
 
+async def _unhandled(name: str, arguments: dict) -> list:
     # Pass through any other tools unmodified
     return [{"type": "text", "text": f"Tool {name} not handled by agent-trace"}]
 
 
+# Intercepted tools, keyed by tool name.
+_HANDLERS = {"Write": _handle_write}
+
+
+@server.call_tool()
+async def handle_tool(name: str, arguments: dict) -> list:
+    return await _HANDLERS.get(name, _unhandled)(name, arguments)
+
+
 # --- Entry point ---
 
 
 async def main():
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    flusher = asyncio.create_task(_flusher())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        await drain_and_stop(flusher)
+        await close_shared_http_clients()
 
 
 if __name__ == "__main__":
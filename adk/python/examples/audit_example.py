@@ -7,27 +7,13 @@ from pathlib import Path
 # Allow importing weil_wallet when run as script (e.g. python examples/example.py)
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from weil_ai.keys import locate_key
 from weil_wallet import PrivateKey, Wallet, WeilClient
 
 
 async def main() -> None:
-    # Path to private key file: script dir, cwd, or parent of script dir (e.g. python/)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    key_path = None
-
-    for candidate in (
-        os.path.join(script_dir, "private_key.wc"),
-        "private_key.wc",
-        os.path.join(os.path.dirname(script_dir), "private_key.wc"),
-    ):
-        if os.path.isfile(candidate):
-            key_path = candidate
-            break
-    if key_path is None:
-        raise FileNotFoundError(
-            "private_key.wc not found. Place it in examples/, python/, or cwd."
-        )
-
+    # Private key file: $WEIL_PRIVATE_KEY, script dir, cwd, or parent of script dir (e.g. python/)
+    key_path = locate_key(os.path.dirname(os.path.abspath(__file__)))
     pk = PrivateKey.from_file(key_path)
     wallet = Wallet(pk)
 
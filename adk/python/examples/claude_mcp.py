@@ -11,24 +11,23 @@ import os
 # Allow importing weil_wallet when run as script (e.g. python examples/example.py)
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from weil_ai.http import shared_http_client
+from weil_ai.keys import locate_key
 from weil_wallet import PrivateKey, Wallet, WeilClient
 
 server = Server("weilchain-audit")
 
+# log_io always returns the same acknowledgement, so encode it once.
+_LOGGED_RESPONSE = json.dumps({"status": "logged", "proceed": True})
+
 
 def _make_client() -> WeilClient:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    for candidate in (
-        os.path.join(script_dir, "private_key.wc"),
-        "private_key.wc",
-        os.path.join(os.path.dirname(script_dir), "private_key.wc"),
-    ):
-        if os.path.isfile(candidate):
-            pk = PrivateKey.from_file(candidate)
-            wallet = Wallet(pk)
-            return WeilClient(wallet, sentinel_host=os.environ.get("SENTINEL_HOST"))
-    raise FileNotFoundError(
-        "private_key.wc not found. Place it in examples/, python/, or cwd."
+    pk = PrivateKey.from_file(locate_key(os.path.dirname(os.path.abspath(__file__))))
+    sentinel_host = os.environ.get("SENTINEL_HOST")
+    return WeilClient(
+        Wallet(pk),
+        sentinel_host=sentinel_host,
+        http_client=shared_http_client(sentinel_host),
     )
 
 
@@ -82,7 +81,7 @@ async def call_tool(name: str, arguments: dict):
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps({"status": "logged", "proceed": True}),
+                text=_LOGGED_RESPONSE,
             )
         ]
 
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from weil_wallet import (
     ContractId,
     MnemonicWallet,
+    WalletAccount,
     WeilClient,
     create_wallet,
 )
@@ -51,21 +52,17 @@ async def main() -> None:
     contract_id = ContractId(CONTRACT_ID_STR)
     sentinel = os.environ.get("SENTINEL_HOST")
 
-    # Execute balance_for with account 0
-    print(f"\n--- Executing {METHOD_NAME} with account 0 ---")
-    weil_wallet_0 = acc0.to_weil_wallet()
-    async with WeilClient(weil_wallet_0, sentinel_host=sentinel) as client:
-        result0 = await client.execute(contract_id, METHOD_NAME, METHOD_ARGS)
-        print("Account 0 result:", result0.status)
-        print("  txn_result:", result0.txn_result)
-
-    # Execute balance_for with account 1
-    print(f"\n--- Executing {METHOD_NAME} with account 1 ---")
-    weil_wallet_1 = acc1.to_weil_wallet()
-    async with WeilClient(weil_wallet_1, sentinel_host=sentinel) as client:
-        result1 = await client.execute(contract_id, METHOD_NAME, METHOD_ARGS)
-        print("Account 1 result:", result1.status)
-        print("  txn_result:", result1.txn_result)
+    # Execute balance_for with both accounts concurrently over one connection.
+    async with WeilClient(acc0.to_weil_wallet(), sentinel_host=sentinel) as client:
+
+        async def run(index: int, account: WalletAccount) -> None:
+            account_client = client.with_wallet(account.to_weil_wallet())
+            result = await account_client.execute(contract_id, METHOD_NAME, METHOD_ARGS)
+            print(f"\n--- {METHOD_NAME} with account {index} ---")
+            print(f"Account {index} result:", result.status)
+            print("  txn_result:", result.txn_result)
+
+        await asyncio.gather(*(run(i, acc) for i, acc in enumerate((acc0, acc1))))
 
     print("\nDone. Both derived accounts can execute contract methods.")
 
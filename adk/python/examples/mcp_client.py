@@ -20,27 +20,16 @@ from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from weil_wallet import PrivateKey, Wallet, WeilClient
 from weil_ai.auth import build_auth_headers
+from weil_ai.http import shared_http_client
+from weil_ai.keys import locate_key
 
 MCP_SERVER_URL = "http://localhost:8001/mcp"
 
 
 def create_weil_client() -> tuple[Wallet, WeilClient]:
     """Load private key from .wc file and return the Wallet alongside a WeilClient."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
-    for candidate in (
-        os.path.join(script_dir, "private_key.wc"),
-        "private_key.wc",
-        os.path.join(os.path.dirname(script_dir), "private_key.wc"),
-    ):
-        if os.path.isfile(candidate):
-            pk = PrivateKey.from_file(candidate)
-            wallet = Wallet(pk)
-
-            return WeilClient(wallet)
-    raise FileNotFoundError(
-        "private_key.wc not found. Place it in examples/, python/, or cwd."
-    )
+    pk = PrivateKey.from_file(locate_key(os.path.dirname(os.path.abspath(__file__))))
+    return WeilClient(Wallet(pk), http_client=shared_http_client())
 
 
 client = create_weil_client()
@@ -1,9 +1,24 @@
 import hashlib
 import time
+from collections import OrderedDict
+
 import coincurve
+from coincurve.ecdsa import cdata_to_der, deserialize_compact
 
 MAX_TIMESTAMP_AGE_SECONDS = 60
 
+# wallet address -> public key recovered on its last successful verification.
+# Lets repeat callers skip key recovery and run a plain ECDSA verify instead.
+_KNOWN_PUBKEYS_MAX = 1024
+_known_pubkeys: "OrderedDict[str, coincurve.PublicKey]" = OrderedDict()
+
+
+def _remember_pubkey(wallet_address: str, pub: coincurve.PublicKey) -> None:
+    _known_pubkeys[wallet_address] = pub
+    _known_pubkeys.move_to_end(wallet_address)
+    if len(_known_pubkeys) > _KNOWN_PUBKEYS_MAX:
+        _known_pubkeys.popitem(last=False)
+
 
 def _derive_address(uncompressed_pubkey: bytes) -> str:
     """
@@ -28,15 +43,17 @@ def verify_weil_signature(
       1. Reject stale timestamps (anti-replay).
       2. Compute SHA256 of the raw message bytes — this is the digest that
          weil_wallet.sign() signs over.
-      3. Decode the 64-byte compact signature (r || s).
+      3. Decode the compact signature: 64 bytes (r || s), or 65 bytes
+         (r || s || v) when the signer appended the recovery id.
       4. Recover the secp256k1 public key from (signature, digest).
-         The compact format carries no recovery-id, so we try 0 and 1.
+         With a recovery id this is a single recovery; a bare 64-byte
+         signature carries none, so we try 0 and 1.
       5. Derive the address from the recovered key and compare with
          X-Wallet-Address.
 
     Args:
         wallet_address: X-Wallet-Address header value
-        signature_hex:  X-Signature header value  (hex of 64 compact bytes)
+        signature_hex:  X-Signature header value  (hex of 64 or 65 compact bytes)
         message:        X-Message header value     (the JSON string that was signed)
         timestamp:      X-Timestamp header value   (Unix seconds, as string)
 
@@ -54,20 +71,38 @@ def verify_weil_signature(
     # 2. SHA256 of the message — mirrors hash_sha256(verify_payload.as_bytes())
     digest = hashlib.sha256(message.encode("utf-8")).digest()  # 32 bytes
 
-    # 3. Decode compact 64-byte signature (r || s)
+    # 3. Decode compact signature (r || s [|| v])
     try:
         sig_bytes = bytes.fromhex(signature_hex)
     except ValueError:
         return False
-    if len(sig_bytes) != 64:
+    if len(sig_bytes) == 65:
+        # Recovery id supplied by the signer: one recovery, no guessing.
+        candidates = (sig_bytes,)
+    elif len(sig_bytes) == 64:
+        # v is the recovery id. We try 0 and 1 (2/3 are valid only for edge-case keys).
+        candidates = (sig_bytes + b"\x00", sig_bytes + b"\x01")
+    else:
         return False
 
+    wallet_address = wallet_address.lower()
+
+    # Known wallet: verify against the cached key. A failure falls through to
+    # recovery, which also accepts signatures verify() rejects (e.g. high-S).
+    pub = _known_pubkeys.get(wallet_address)
+    if pub is not None:
+        try:
+            der = cdata_to_der(deserialize_compact(sig_bytes[:64]))
+            if pub.verify(der, digest, hasher=None):
+                _known_pubkeys.move_to_end(wallet_address)
+                return True
+        except ValueError:
+            pass
+
     # 4 + 5. Recover public key and check address.
     # coincurve expects a 65-byte recoverable signature: r(32) || s(32) || v(1)
-    # v is the recovery id. We try 0 and 1 (2/3 are valid only for edge-case keys).
-    for recovery_id in (0, 1):
+    for recoverable_sig in candidates:
         try:
-            recoverable_sig = sig_bytes + bytes([recovery_id])
             pub = coincurve.PublicKey.from_signature_and_message(
                 recoverable_sig,
                 digest,
@@ -76,7 +111,8 @@ def verify_weil_signature(
             # format(compressed=False) → 65 bytes (0x04 || x || y)
             # mirrors libsecp256k1 PublicKey::serialize() which returns uncompressed form
             derived = _derive_address(pub.format(compressed=False))
-            if derived == wallet_address.lower():
+            if derived == wallet_address:
+                _remember_pubkey(wallet_address, pub)
                 return True
         except Exception:
             continue
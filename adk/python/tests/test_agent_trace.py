@@ -0,0 +1,67 @@
+"""Line ranges recorded by the agent-trace example."""
+
+import asyncio
+import importlib
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+
+
+@pytest.fixture(scope="module")
+def agent_trace(tmp_path_factory):
+    # The example builds its client at import time, so it needs a key file.
+    key = tmp_path_factory.mktemp("key") / "private_key.wc"
+    key.write_text(bytes(range(1, 33)).hex())
+    with mock.patch.dict(os.environ, {"WEIL_PRIVATE_KEY": str(key)}), mock.patch.object(
+        sys, "path", [str(EXAMPLES_DIR), *sys.path]
+    ):
+        try:
+            return importlib.import_module("agent_trace")
+        except AttributeError as exc:
+            # The example registers tools with the mcp 1.x Server decorators.
+            pytest.skip(f"agent_trace needs the mcp 1.x Server API: {exc}")
+
+
+@pytest.mark.parametrize(
+    "old, new, expected",
+    [
+        (b"a\nb\n", b"a\nx\ny\nb\n", [2, 3]),  # insert
+        (b"a\nb\nc\n", b"a\nX\nc\n", [2, 2]),  # replace
+        (b"a\nb\nc\n", b"a\nc\n", []),  # delete only
+        (b"a\nb\nc\nd\n", b"X\nb\nd\nY\n", [1, 1, 4, 4]),  # mixed
+        (b"a\nb", b"a\nb\n", []),  # trailing newline only
+        (b"a\n", b"a\nb", [2, 2]),  # new last line without newline
+        (b"a\rb\r", b"a\rx\rb\r", [2, 2]),  # CR-only line endings
+        (b"a\r\nb\r\n", b"a\nb\n", []),  # line endings alone don't count
+    ],
+)
+def test_compute_ranges(agent_trace, old, new, expected):
+    assert agent_trace.compute_ranges(old, new) == expected
+
+
+@pytest.mark.parametrize(
+    "content", ["a\n", "a\nb\nc\n", "a\nb", "a\rb\r", "a\r\nb\r\n", "\n\n"]
+)
+def test_new_file_shortcut_matches_full_diff(agent_trace, tmp_path, content):
+    recorded = []
+
+    async def capture(record):
+        recorded.append(record)
+
+    path = tmp_path / "new.txt"
+    with mock.patch.object(
+        agent_trace, "build_trace_record", lambda _path, ranges: ranges
+    ), mock.patch.object(agent_trace, "post_trace", capture):
+        asyncio.run(
+            agent_trace._handle_write(
+                "Write", {"file_path": str(path), "content": content}
+            )
+        )
+
+    assert recorded == [agent_trace.compute_ranges(b"", content.encode())]
+    assert path.read_bytes() == content.encode()
@@ -0,0 +1,79 @@
+"""Auth header signing and verification (weil_ai.auth, weil_middleware)."""
+
+import asyncio
+import json
+
+import pytest
+
+from weil_ai.auth import build_auth_headers, verify_weil_signature
+from weil_ai.mcp import current_wallet_addr, weil_middleware
+from weil_wallet import PrivateKey, Wallet
+
+
+def _wallet() -> Wallet:
+    return Wallet(PrivateKey.from_bytes(bytes(range(1, 33))))
+
+
+def _verify(headers: dict, address: str) -> bool:
+    return verify_weil_signature(
+        address, headers["X-Signature"], headers["X-Message"], headers["X-Timestamp"]
+    )
+
+
+def test_wallet_address_must_be_64_hex_chars():
+    headers = build_auth_headers(_wallet(), cache_ttl=0)
+    address = headers["X-Wallet-Address"]
+    assert _verify(headers, address)
+    assert _verify(headers, address.upper())
+
+    spaced = " ".join(address[i : i + 2] for i in range(0, 64, 2))
+    assert not _verify(headers, spaced)
+    assert not _verify(headers, spaced[:64])
+    assert not _verify(headers, address[:62])
+    assert not _verify(headers, address + "00")
+    assert not _verify(headers, "0x" + address[2:])
+
+
+def test_middleware_stores_lowercase_address():
+    headers = build_auth_headers(_wallet(), cache_ttl=0)
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(current_wallet_addr())
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [
+            (b"x-wallet-address", headers["X-Wallet-Address"].upper().encode()),
+            (b"x-signature", headers["X-Signature"].encode()),
+            (b"x-message", headers["X-Message"].encode()),
+            (b"x-timestamp", headers["X-Timestamp"].encode()),
+        ],
+    }
+    asyncio.run(weil_middleware()(app)(scope, None, None))
+    assert seen == [headers["X-Wallet-Address"]]
+
+
+def test_message_matches_json_dumps():
+    headers = build_auth_headers(_wallet(), cache_ttl=0)
+    expected = json.dumps(
+        {"timestamp": headers["X-Timestamp"]}, separators=(",", ":"), sort_keys=True
+    )
+    assert headers["X-Message"] == expected
+
+
+@pytest.mark.parametrize("recoverable, sig_len", [(False, 64), (True, 65)])
+def test_sign_verify_round_trip(recoverable, sig_len):
+    wallet = _wallet()
+    headers = build_auth_headers(wallet, cache_ttl=0, recoverable=recoverable)
+    assert len(bytes.fromhex(headers["X-Signature"])) == sig_len
+    assert headers["X-Wallet-Address"] == wallet.get_key_address()
+    assert _verify(headers, headers["X-Wallet-Address"])
+
+    other = build_auth_headers(
+        Wallet(PrivateKey.from_bytes(bytes(range(2, 34)))), cache_ttl=0
+    )
+    assert not _verify(headers, other["X-Wallet-Address"])
+    tampered = dict(headers, **{"X-Message": headers["X-Message"].replace('"}', '0"}')})
+    assert not _verify(tampered, headers["X-Wallet-Address"])
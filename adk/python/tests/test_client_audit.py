@@ -0,0 +1,81 @@
+"""The @client.audit() decorator (weil_wallet.client)."""
+
+import asyncio
+import logging
+
+from weil_wallet import ContractId, PrivateKey, Wallet, WeilClient, WeilContractClient
+
+CONTRACT_ID = "aaaaaayvitmkip5jdz524cnavebftb5prmgjv32eq5ppvpaxdwgu2knxmu"
+
+
+def _client() -> WeilClient:
+    wallet = Wallet(PrivateKey.from_bytes(bytes(range(1, 33))))
+    return WeilClient(wallet, 1, sentinel_host="http://127.0.0.1:9")
+
+
+def test_decorator_logs_failed_submission_and_runs_handler(monkeypatch, caplog):
+    async def failing_submit(self, log):
+        raise RuntimeError("sentinel down")
+
+    monkeypatch.setattr(WeilClient, "_submit_audit", failing_submit)
+
+    async def scenario():
+        client = _client()
+
+        @client.audit()
+        async def handler(user, action="read"):
+            return f"{user}:{action}"
+
+        assert await handler("alice", action="write") == "alice:write"
+        await client.close()
+        assert not client._pending_audits
+
+    with caplog.at_level(logging.ERROR, logger="weil_wallet.client"):
+        asyncio.run(scenario())
+
+    [record] = caplog.records
+    assert record.getMessage() == "audit submission failed"
+    assert "sentinel down" in str(record.exc_info[1])
+
+
+def test_decorator_submits_arguments(monkeypatch):
+    entries = []
+
+    async def submit(self, log):
+        entries.append(log)
+
+    monkeypatch.setattr(WeilClient, "_submit_audit", submit)
+
+    async def scenario():
+        client = _client()
+
+        @client.audit()
+        async def handler(user, action="read"):
+            return user
+
+        await handler("alice", action="write")
+        await client.close()
+
+    asyncio.run(scenario())
+    assert entries == ['{"user": "alice", "action": "write"}']
+
+
+def test_audit_log_args_keep_json_dumps_format(monkeypatch):
+    calls = []
+
+    async def execute(self, method_name, method_args, should_hide_args, is_non_blocking):
+        calls.append(method_args)
+
+    async def contract_id(self):
+        return ContractId(CONTRACT_ID)
+
+    monkeypatch.setattr(WeilClient, "_get_audit_contract_id", contract_id)
+    monkeypatch.setattr(WeilContractClient, "execute", execute)
+
+    async def scenario():
+        client = _client()
+        await client.audit('{"a": 1} é ☃')
+        await client.close()
+
+    asyncio.run(scenario())
+    assert calls == ['{"log": "{\\"a\\": 1} \\u00e9 \\u2603"}']
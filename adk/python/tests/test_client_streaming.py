@@ -0,0 +1,102 @@
+"""Open streams must not starve execute() of pool connections."""
+
+import asyncio
+
+from weil_wallet import ContractId, PrivateKey, Wallet, WeilClient
+
+CONTRACT_ID = "aaaaaayvitmkip5jdz524cnavebftb5prmgjv32eq5ppvpaxdwgu2knxmu"
+
+
+class _Sentinel:
+    """Minimal HTTP/1.1 server: the first *streams* requests get a chunked body
+    that stays open until ``finish`` is set; later requests get a JSON result."""
+
+    def __init__(self, streams: int) -> None:
+        self.streams = streams
+        self.requests = 0
+        self.finish = asyncio.Event()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                self.requests += 1
+                if self.requests <= self.streams:
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                        b"5\r\nhello\r\n"
+                    )
+                    await writer.drain()
+                    await self.finish.wait()
+                    writer.write(b"0\r\n\r\n")
+                else:
+                    body = b'{"status":"Finalized","txn_result":"ok"}'
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+                    )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _with_server(concurrency: int, scenario) -> None:
+    sentinel = _Sentinel(streams=concurrency)
+    server = await asyncio.start_server(sentinel.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    wallet = Wallet(PrivateKey.from_bytes(bytes(range(1, 33))))
+    client = WeilClient(wallet, concurrency, sentinel_host=f"http://127.0.0.1:{port}")
+    try:
+        await scenario(client.to_contract_client(ContractId(CONTRACT_ID)), sentinel)
+    finally:
+        sentinel.finish.set()
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+async def _open_streams(contract_client, count: int) -> list:
+    streams = []
+    for _ in range(count):
+        it = (await contract_client.execute_with_streaming("generate", "{}")).__aiter__()
+        assert await it.__anext__() == b"hello"
+        streams.append(it)
+    return streams
+
+
+def test_execute_runs_while_concurrency_streams_are_open():
+    async def scenario(contract_client, sentinel):
+        streams = await _open_streams(contract_client, 2)
+        result = await asyncio.wait_for(contract_client.execute("m", "{}"), 5)
+        assert result.txn_result == "ok"
+        sentinel.finish.set()
+        for it in streams:
+            assert [chunk async for chunk in it] == []
+
+    asyncio.run(_with_server(2, scenario))
+
+
+def test_extra_stream_waits_for_an_open_one_to_close():
+    async def scenario(contract_client, sentinel):
+        streams = await _open_streams(contract_client, 2)
+        extra = (await contract_client.execute_with_streaming("generate", "{}")).__aiter__()
+        pending = asyncio.ensure_future(extra.__anext__())
+        await asyncio.sleep(0.2)
+        assert not pending.done()
+        assert sentinel.requests == 2
+
+        await streams[0].aclose()
+        await asyncio.wait_for(pending, 5)
+        assert sentinel.requests == 3
+        await extra.aclose()
+        await streams[1].aclose()
+
+    asyncio.run(_with_server(2, scenario))
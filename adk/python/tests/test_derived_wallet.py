@@ -0,0 +1,30 @@
+"""MnemonicWallet batch derivation (weil_wallet.derived_wallet)."""
+
+import pytest
+
+from weil_wallet import derived_wallet
+from weil_wallet.derived_wallet import create_wallet
+
+pytest.importorskip("eth_hash.auto")
+
+
+def test_parallel_derive_matches_derive_account(monkeypatch):
+    mnemonic = create_wallet().mnemonic
+    pools = []
+
+    class RecordingPool(derived_wallet.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(derived_wallet, "_PARALLEL_DERIVE_MIN", 2)
+    monkeypatch.setattr(derived_wallet, "ProcessPoolExecutor", RecordingPool)
+
+    indices = [0, 1, 2, 7, 1, 100]
+    batch = create_wallet(mnemonic=mnemonic).derive_accounts(indices, max_workers=2)
+    assert len(pools) == 1
+
+    single = create_wallet(mnemonic=mnemonic)
+    assert list(batch) == [0, 1, 2, 7, 100]
+    for index, account in batch.items():
+        assert account == single.derive_account(index)
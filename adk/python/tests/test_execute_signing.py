@@ -0,0 +1,104 @@
+"""The signed execute payload must stay byte-identical to the original
+``json.dumps(..., sort_keys=True)`` encoding, or the server rejects it."""
+
+import asyncio
+import json
+
+import pytest
+
+from weil_wallet import ContractId, PrivateKey, Wallet, WeilClient
+
+CONTRACT_ID = "aaaaaayvitmkip5jdz524cnavebftb5prmgjv32eq5ppvpaxdwgu2knxmu"
+
+METHOD_ARGS = [
+    "{}",
+    '{"log": "hello from python"}',
+    '{"log": "héllo ☃ \U0001f600"}',
+    '{"q": "quote \\" backslash \\\\ newline \\n tab \\t nul \\u0000"}',
+    'raw "quotes" and \\ backslashes\n\r\t\x00\x1f\x7f',
+    "</script>&<>'",
+    "",
+]
+METHOD_NAMES = ["audit", "méthode \"quoted\""]
+
+
+def _reference_payload(header, method_name, method_args, should_hide_args) -> bytes:
+    """The encoding _sign_execute_args used before it was templated."""
+    user_txn = {
+        "type": "SmartContractExecutor",
+        "contract_address": CONTRACT_ID,
+        "contract_method": method_name,
+        "contract_input_bytes": method_args,
+        "should_hide_args": should_hide_args,
+    }
+    payload = {
+        "from_addr": header.from_addr,
+        "nonce": header.nonce,
+        "to_addr": header.to_addr,
+        "user_txn": user_txn,
+    }
+    canonical = dict(sorted(payload.items()))
+    return json.dumps(canonical, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+@pytest.fixture
+def signed(monkeypatch):
+    """Capture the bytes handed to Wallet.sign."""
+    captured = []
+
+    def sign(self, buf):
+        captured.append(buf)
+        return "00" * 64
+
+    monkeypatch.setattr(Wallet, "sign", sign)
+    return captured
+
+
+@pytest.fixture
+def contract_client():
+    wallet = Wallet(
+        PrivateKey.from_bytes(bytes(range(1, 33))), account_address="accøunt\"1"
+    )
+    client = WeilClient(wallet, 1, sentinel_host="http://127.0.0.1:9")
+    yield client.to_contract_client(ContractId(CONTRACT_ID))
+    asyncio.run(client.close())
+
+
+@pytest.mark.parametrize("should_hide_args", [True, False])
+@pytest.mark.parametrize("method_name", METHOD_NAMES)
+@pytest.mark.parametrize("method_args", METHOD_ARGS)
+def test_template_matches_json_dumps(
+    signed, contract_client, method_name, method_args, should_hide_args
+):
+    base_txn, _, _ = asyncio.run(
+        contract_client._sign_and_construct_txn(method_name, method_args, should_hide_args)
+    )
+    assert signed == [
+        _reference_payload(base_txn.header, method_name, method_args, should_hide_args)
+    ]
+
+
+@pytest.mark.parametrize("should_hide_args", [True, False])
+@pytest.mark.parametrize("method_name", METHOD_NAMES)
+def test_prebuilt_signer_matches_json_dumps(
+    signed, contract_client, method_name, should_hide_args
+):
+    signer = contract_client.build_signer(method_name, should_hide_args)
+
+    async def sign_all():
+        return [await signer(method_args) for method_args in METHOD_ARGS]
+
+    results = asyncio.run(sign_all())
+    assert signed == [
+        _reference_payload(base_txn.header, method_name, method_args, should_hide_args)
+        for (base_txn, _, _), method_args in zip(results, METHOD_ARGS)
+    ]
+
+
+def test_execute_rejects_signer_from_another_client(contract_client):
+    other = contract_client._client.with_wallet(
+        Wallet(PrivateKey.from_bytes(bytes(range(2, 34))))
+    )
+    signer = other.to_contract_client(ContractId(CONTRACT_ID)).build_signer("audit")
+    with pytest.raises(ValueError, match="different WeilClient"):
+        asyncio.run(contract_client.execute("audit", "{}", signer=signer))
@@ -0,0 +1,270 @@
+"""secured() permission checks and their caches (weil_ai.mcp)."""
+
+import asyncio
+
+import pytest
+
+from weil_ai import mcp
+from weil_ai.auth import build_auth_headers, verify_weil_signature
+from weil_wallet import ContractId, PrivateKey, Wallet
+from weil_wallet.transaction import TransactionResult
+
+CONTRACT_ID = "aaaaaayvitmkip5jdz524cnavebftb5prmgjv32eq5ppvpaxdwgu2knxmu"
+WALLET = "ab" * 32
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    """Stub Sentinel: applet lookups and key_has_purpose submissions are counted,
+    and key_has_purpose answers with ``chain.txn_result``."""
+
+    class Chain:
+        txn_result = '{"Ok":"true"}'
+        lookups = 0
+        checks = 0
+        gate: "asyncio.Event | None" = None
+
+    async def get_applet_id_for_name(http_client, name):
+        Chain.lookups += 1
+        return ContractId(CONTRACT_ID)
+
+    async def submit_transaction(payload, http_client, *, is_non_blocking=False):
+        Chain.checks += 1
+        if Chain.gate is not None:
+            await Chain.gate.wait()
+        return TransactionResult(txn_result=Chain.txn_result)
+
+    monkeypatch.setattr(mcp.WeilClient, "get_applet_id_for_name", get_applet_id_for_name)
+    monkeypatch.setattr(mcp.PlatformApi, "submit_transaction", submit_transaction)
+    mcp._perm_cache.clear()
+    mcp._perm_inflight.clear()
+    yield Chain
+    mcp._perm_cache.clear()
+    mcp._perm_inflight.clear()
+
+
+def _tool():
+    @mcp.secured("svc.weil")
+    async def tool() -> str:
+        return "ran"
+
+    return tool
+
+
+async def _call(tool, wallet: str = WALLET):
+    mcp._weil_wallet_addr.set(wallet)
+    return await tool()
+
+
+def _denied(result) -> bool:
+    return isinstance(result, list) and isinstance(result[0], mcp.mcp_types.TextContent)
+
+
+@pytest.mark.parametrize(
+    "txn_result, allowed",
+    [
+        ('{"Ok":"true"}', True),
+        ('{"Ok":"false"}', False),
+        ('{"Err":"no such key"}', False),
+        ('{"Ok":true}', False),
+        ('"true"', False),
+        ('["Ok"]', False),
+        ("null", False),
+    ],
+)
+def test_key_has_purpose_result_shapes(chain, txn_result, allowed):
+    chain.txn_result = txn_result
+    result = asyncio.run(_call(_tool()))
+    assert (result == "ran") is allowed
+    assert _denied(result) is not allowed
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the time module seen by weil_ai.mcp with a settable clock."""
+
+    class Clock:
+        now = 1_000_000.0
+
+        @classmethod
+        def monotonic(cls) -> float:
+            return cls.now
+
+        @classmethod
+        def time(cls) -> float:
+            return cls.now
+
+    monkeypatch.setattr(mcp, "time", Clock)
+    monkeypatch.setattr(mcp, "_PERM_CACHE_TTL", 30.0)
+    monkeypatch.setattr(mcp, "_PERM_CACHE_DENY_TTL", 5.0)
+    return Clock
+
+
+def test_grant_is_cached_for_ttl(chain, clock):
+    tool = _tool()
+    assert asyncio.run(_call(tool)) == "ran"
+    clock.now += 29.9
+    assert asyncio.run(_call(tool)) == "ran"
+    assert chain.checks == 1
+
+    clock.now += 0.1
+    assert asyncio.run(_call(tool)) == "ran"
+    assert chain.checks == 2
+
+
+def test_grant_is_cached_per_wallet(chain, clock):
+    tool = _tool()
+    asyncio.run(_call(tool))
+    asyncio.run(_call(tool, wallet="cd" * 32))
+    assert chain.checks == 2
+
+
+def test_denial_expires_after_five_seconds(chain, clock):
+    tool = _tool()
+    chain.txn_result = '{"Ok":"false"}'
+    assert _denied(asyncio.run(_call(tool)))
+
+    # The wallet is granted on-chain; the cached denial holds for 5 s only.
+    chain.txn_result = '{"Ok":"true"}'
+    clock.now += 4.9
+    assert _denied(asyncio.run(_call(tool)))
+    assert chain.checks == 1
+
+    clock.now += 0.1
+    assert asyncio.run(_call(tool)) == "ran"
+    assert chain.checks == 2
+
+
+def test_zero_ttl_disables_the_cache(chain, clock, monkeypatch):
+    monkeypatch.setattr(mcp, "_PERM_CACHE_TTL", 0.0)
+    monkeypatch.setattr(mcp, "_PERM_CACHE_DENY_TTL", 0.0)
+    tool = _tool()
+    asyncio.run(_call(tool))
+    asyncio.run(_call(tool))
+    assert chain.checks == 2
+    assert not mcp._perm_cache
+
+
+def test_concurrent_checks_are_coalesced(chain, clock):
+    tool = _tool()
+
+    async def main():
+        chain.gate = asyncio.Event()
+        calls = [asyncio.create_task(_call(tool)) for _ in range(3)]
+        while chain.checks == 0:
+            await asyncio.sleep(0)
+        # Cancelling one waiter must not cancel the shared check.
+        calls[0].cancel()
+        await asyncio.sleep(0)
+        chain.gate.set()
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    cancelled, *results = asyncio.run(main())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert results == ["ran", "ran"]
+    assert chain.checks == 1
+    assert not mcp._perm_inflight
+    assert mcp._perm_cache_get(WALLET, "svc.weil") is True
+
+
+def test_applet_id_is_cached_for_ttl(chain, clock, monkeypatch):
+    # Disable the permission cache so every call reaches check_permission().
+    monkeypatch.setattr(mcp, "_PERM_CACHE_TTL", 0.0)
+    tool = _tool()
+    asyncio.run(_call(tool))
+    clock.now += mcp._APPLET_ID_TTL - 0.1
+    asyncio.run(_call(tool))
+    assert (chain.lookups, chain.checks) == (1, 2)
+
+    clock.now += 0.1
+    asyncio.run(_call(tool))
+    assert (chain.lookups, chain.checks) == (2, 3)
+
+
+@pytest.fixture
+def verify(monkeypatch):
+    """Count real signature verifications behind _verify_headers_cached()."""
+    calls = []
+
+    def counting_verify(*args):
+        calls.append(args)
+        return verify_weil_signature(*args)
+
+    monkeypatch.setattr(mcp, "verify_weil_signature", counting_verify)
+    mcp._verify_cache.clear()
+    yield calls
+    mcp._verify_cache.clear()
+
+
+def _signed(seed: int = 1) -> dict:
+    wallet = Wallet(PrivateKey.from_bytes(bytes(range(seed, seed + 32))))
+    return build_auth_headers(wallet, cache_ttl=0)
+
+
+def _verify_cached(headers: dict, **overrides: str) -> bool:
+    fields = {
+        "wallet_address": headers["X-Wallet-Address"],
+        "signature_hex": headers["X-Signature"],
+        "message": headers["X-Message"],
+        "timestamp": headers["X-Timestamp"],
+    }
+    return mcp._verify_headers_cached(**(fields | overrides))
+
+
+def test_cached_verification_does_not_authorize_another_address(verify):
+    headers = _signed()
+    assert _verify_cached(headers)
+    assert _verify_cached(headers)
+    assert len(verify) == 1
+
+    other = _signed(2)["X-Wallet-Address"]
+    assert not _verify_cached(headers, wallet_address=other)
+    assert not _verify_cached(headers, wallet_address=other)
+    assert len(verify) == 3
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("signature_hex", "00" * 64),
+        ("message", '{"timestamp":"0"}'),
+        ("timestamp", None),
+    ],
+)
+def test_verify_cache_keys_on_every_header(verify, field, value):
+    headers = _signed()
+    assert _verify_cached(headers)
+    if value is None:
+        value = str(int(headers["X-Timestamp"]) + 1)
+    # Changing any one header must miss the cache and verify again.
+    _verify_cached(headers, **{field: value})
+    assert len(verify) == 2
+
+
+def test_verify_cache_expires_with_timestamp_window(verify, clock):
+    headers = _signed()
+    ts = int(headers["X-Timestamp"])
+
+    # Verified late in the window: the entry lives until ts + 300, not now + 60.
+    clock.now = ts + mcp._ALLOWED_TIMESTAMP_DRIFT - 50
+    assert _verify_cached(headers)
+    clock.now = ts + mcp._ALLOWED_TIMESTAMP_DRIFT - 0.1
+    assert _verify_cached(headers)
+    assert len(verify) == 1
+
+    clock.now = ts + mcp._ALLOWED_TIMESTAMP_DRIFT
+    _verify_cached(headers)
+    assert len(verify) == 2
+
+
+def test_verify_cache_entry_lives_at_most_ttl(verify, clock):
+    headers = _signed()
+    clock.now = int(headers["X-Timestamp"])
+    assert _verify_cached(headers)
+    clock.now += mcp._VERIFY_CACHE_TTL - 0.1
+    assert _verify_cached(headers)
+    assert len(verify) == 1
+
+    clock.now += 0.1
+    assert _verify_cached(headers)
+    assert len(verify) == 2
@@ -0,0 +1,68 @@
+"""WeilAgent attribute forwarding and the background audit loop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from weil_ai import WeilAgent
+from weil_ai.agents.weil import _stop_bg_loop
+from weil_wallet import PrivateKey, Wallet
+
+
+class _Inner:
+    pass
+
+
+def _agent():
+    inner = _Inner()
+    wallet = Wallet(PrivateKey.from_bytes(bytes(range(1, 33))))
+    return inner, WeilAgent(inner, wallet=wallet)
+
+
+def test_unknown_attributes_are_forwarded():
+    inner, agent = _agent()
+    agent.temperature = 0.2
+    assert inner.temperature == 0.2
+    assert agent.temperature == 0.2
+
+
+@pytest.mark.parametrize("name", ["weil_wallet", "audit", "get_auth_headers"])
+def test_proxy_names_are_not_forwarded(name):
+    inner, agent = _agent()
+    with pytest.raises(AttributeError):
+        setattr(agent, name, object())
+    assert not hasattr(inner, name)
+
+
+def test_stop_bg_loop_finishes_pending_audits():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    done = []
+
+    async def audit():
+        await asyncio.sleep(0.05)
+        done.append(True)
+
+    asyncio.run_coroutine_threadsafe(audit(), loop)
+    _stop_bg_loop(loop, thread, timeout=5.0)
+    assert done == [True]
+    assert not thread.is_alive()
+    loop.close()
+
+
+def test_stop_bg_loop_gives_up_after_timeout():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(60), loop)
+    _stop_bg_loop(loop, thread, timeout=0.05)
+    assert not thread.is_alive()
+    # The abandoned sleep is still pending; cancel it so closing is clean.
+    pending = asyncio.all_tasks(loop)
+    assert len(pending) == 1
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.close()
@@ -3,6 +3,8 @@
 from .agents import WeilAgent, weil_agent
 from .agents import weil_agent as agent
 from .auth import build_auth_headers, verify_weil_signature
+from .http import close_shared_http_clients, shared_http_client
+from .keys import locate_key
 from .mcp import current_wallet_addr, secured, weil_middleware
 
 __all__ = [
@@ -13,6 +15,11 @@ __all__ = [
     # auth
     "build_auth_headers",
     "verify_weil_signature",
+    # http
+    "shared_http_client",
+    "close_shared_http_clients",
+    # keys
+    "locate_key",
     # mcp
     "secured",
     "weil_middleware",
@@ -34,8 +34,13 @@ Usage::
 from __future__ import annotations
 
 import asyncio
+import atexit
 import concurrent.futures
+import contextvars
+import functools
 import os
+import stat
+import threading
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -44,6 +49,95 @@ from weil_wallet.transaction import TransactionResult
 
 from weil_ai.auth import build_auth_headers
 
+# Audits run on one long-lived event loop in a daemon thread. Each agent's
+# WeilClient (and its HTTP pool) is created and always used on this loop, so
+# audit() never builds a fresh loop or connection pool per call.
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+# How long interpreter exit waits for audits still running on the background
+# loop. Anything not finished by then is dropped with the daemon thread.
+_BG_LOOP_EXIT_TIMEOUT: float = 5.0
+
+
+def _stop_bg_loop(
+    loop: asyncio.AbstractEventLoop, thread: threading.Thread, timeout: float
+) -> None:
+    """Let pending tasks on *loop* finish (up to *timeout*), then stop it and
+    join its *thread*."""
+
+    async def _drain() -> None:
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+        loop.stop()
+
+    asyncio.run_coroutine_threadsafe(_drain(), loop)
+    thread.join(timeout + 1.0)
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Return the background audit loop, starting its thread on first use."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="weil-audit-loop", daemon=True
+            )
+            thread.start()
+            # At interpreter exit, finish in-flight audits before the daemon
+            # thread is torn down.
+            atexit.register(_stop_bg_loop, loop, thread, _BG_LOOP_EXIT_TIMEOUT)
+            _bg_loop = loop
+    return _bg_loop
+
+
+def _run_on_bg_loop(coro: Any) -> concurrent.futures.Future:
+    """Schedule *coro* on the background loop and return a thread-safe future.
+
+    Like ``asyncio.run_coroutine_threadsafe`` but the task starts from an empty
+    ``contextvars.Context`` instead of a copy of the caller's: audits never read
+    the caller's context variables, so there is nothing worth copying.
+    """
+    loop = _get_bg_loop()
+    result: concurrent.futures.Future = concurrent.futures.Future()
+
+    def _copy_outcome(task: asyncio.Task) -> None:
+        if task.cancelled():
+            result.set_exception(concurrent.futures.CancelledError())
+        elif task.exception() is not None:
+            result.set_exception(task.exception())
+        else:
+            result.set_result(task.result())
+
+    def _start() -> None:
+        if not result.set_running_or_notify_cancel():
+            coro.close()
+            return
+        loop.create_task(coro).add_done_callback(_copy_outcome)
+
+    loop.call_soon_threadsafe(_start, context=contextvars.Context())
+    return result
+
+
+@functools.lru_cache(maxsize=8)
+def _load_privkey_cached(path_str: str, mtime_ns: int) -> PrivateKey:
+    # mtime_ns is part of the key so a rotated key file is re-read.
+    return PrivateKey.from_file(Path(path_str))
+
+
+def _load_private_key(private_key_path: Union[str, Path]) -> PrivateKey:
+    """Load a ``.wc`` key file, reusing the parsed key while the file is unchanged."""
+    path = Path(private_key_path)
+    try:
+        st = path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(f"Private key file not found: {path}")
+    return _load_privkey_cached(str(path.resolve()), st.st_mtime_ns)
+
 
 class WeilAgent:
     """Proxy wrapper that attaches a Weil wallet identity to any agent.
@@ -52,19 +146,9 @@ class WeilAgent:
     Weil-specific names: ``get_auth_headers``, ``audit``, ``weil_wallet``.
     """
 
-    _WEIL_ATTRS = frozenset(
-        {
-            "_agent",
-            "_wallet",
-            "_weil_client",
-            "_sentinel_host",
-            "get_auth_headers",
-            "audit",
-            "weil_wallet",
-            "_get_client",
-            "_audit_async",
-        }
-    )
+    # No instance __dict__: the proxy's own state lives in these slots and
+    # __setattr__ forwards every name WeilAgent does not define.
+    __slots__ = ("_agent", "_wallet", "_weil_client", "_sentinel_host")
 
     def __init__(
         self,
@@ -90,10 +174,7 @@ class WeilAgent:
             raise ValueError("Provide either wallet= or private_key_path=.")
 
         if wallet is None:
-            path = Path(private_key_path)
-            if not path.is_file():
-                raise FileNotFoundError(f"Private key file not found: {path}")
-            wallet = Wallet(PrivateKey.from_file(path))
+            wallet = Wallet(_load_private_key(private_key_path))
 
         object.__setattr__(self, "_agent", agent)
         object.__setattr__(self, "_wallet", wallet)
@@ -129,14 +210,10 @@ class WeilAgent:
     def audit(self, log: str) -> TransactionResult:
         """Write *log* to the on-chain auditor applet under this agent's identity.
 
-        Safe to call from both sync and async contexts.
+        Safe to call from both sync and async contexts: the submission runs on
+        the shared background loop and this call blocks until it completes.
         """
-        try:
-            asyncio.get_running_loop()
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                return pool.submit(asyncio.run, self._audit_async(log)).result()
-        except RuntimeError:
-            return asyncio.run(self._audit_async(log))
+        return _run_on_bg_loop(self._audit_async(log)).result()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -161,10 +238,14 @@ class WeilAgent:
     # ------------------------------------------------------------------
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(object.__getattribute__(self, "_agent"), name)
+        # Only reached when normal lookup (slots, class attributes) fails.
+        agent = object.__getattribute__(self, "_agent")
+        return getattr(agent, name)
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in WeilAgent._WEIL_ATTRS:
+        # Names the proxy defines stay on the proxy: slots are assigned, and
+        # read-only ones (weil_wallet, audit, ...) raise AttributeError.
+        if name in WeilAgent.__slots__ or hasattr(WeilAgent, name):
             object.__setattr__(self, name, value)
         else:
             setattr(object.__getattribute__(self, "_agent"), name, value)
@@ -173,8 +254,9 @@ class WeilAgent:
         """Close the underlying WeilClient if one was created."""
         client = object.__getattribute__(self, "_weil_client")
         if client is not None:
-            await client.close()
             object.__setattr__(self, "_weil_client", None)
+            # The client lives on the background loop; close it there.
+            await asyncio.wrap_future(_run_on_bg_loop(client.close()))
 
     async def __aenter__(self) -> "WeilAgent":
         return self
@@ -221,10 +303,7 @@ def weil_agent(
     if isinstance(key_or_wallet, Wallet):
         wallet = key_or_wallet
     else:
-        path = Path(key_or_wallet)
-        if not path.is_file():
-            raise FileNotFoundError(f"Private key file not found: {path}")
-        wallet = Wallet(PrivateKey.from_file(path))
+        wallet = Wallet(_load_private_key(key_or_wallet))
 
     def decorator(fn: Any) -> Any:
         def wrapper(*args: Any, **kwargs: Any) -> WeilAgent:
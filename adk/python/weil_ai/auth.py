@@ -13,44 +13,89 @@ Server side:
 from __future__ import annotations
 
 import hashlib
-import json
+import threading
 import time
 
 import coincurve
 
-from weil_wallet.utils import get_address_from_public_key
 from weil_wallet.wallet import Wallet
 
 # Maximum tolerated age of a request timestamp (seconds).
 # Matches _ALLOWED_TIMESTAMP_DRIFT used by weil_middleware().
 MAX_TIMESTAMP_AGE_SECONDS: int = 300  # 5 minutes
 
-
-def build_auth_headers(wallet: Wallet) -> dict:
+# How long build_auth_headers() reuses a signed header set. Half of the
+# strictest verifier window in this repo (examples/verify_me.py accepts 60 s),
+# so a cached header still has margin for clock skew and network latency.
+DEFAULT_HEADER_CACHE_TTL: int = 30
+
+# (signer public key, recoverable) -> (generated_at, headers). Keyed by the
+# active account's compressed key, so switching accounts on a Wallet never
+# reuses headers.
+_header_cache: dict[tuple[bytes, bool], tuple[int, dict]] = {}
+_header_cache_lock = threading.Lock()
+_HEADER_CACHE_MAX = 1024
+
+
+def build_auth_headers(
+    wallet: Wallet,
+    *,
+    cache_ttl: int = DEFAULT_HEADER_CACHE_TTL,
+    refresh: bool = False,
+    recoverable: bool = False,
+) -> dict:
     """Build the four auth headers required by weil_middleware().
 
     Signs a canonical JSON payload of ``{"timestamp": <ts>}`` with the wallet
     private key so the server can recover the signer address and verify ownership.
 
+    Headers are reused for up to *cache_ttl* seconds per signing key, which
+    keeps an ECDSA signature off every outbound request.
+
     Args:
-        wallet: Signing wallet (holds the private key).
+        wallet:    Signing wallet (holds the private key).
+        cache_ttl: Seconds a signed header set may be reused. ``0`` disables
+                   caching.
+        refresh:   Force a freshly signed header set.
+        recoverable: Append the recovery id to ``X-Signature`` (65 bytes
+                   instead of 64) so verify_weil_signature() needs a single
+                   key recovery. Only enable when every verifier accepts
+                   65-byte signatures.
 
     Returns:
         Dict with keys ``X-Wallet-Address``, ``X-Signature``, ``X-Message``,
         and ``X-Timestamp``.
     """
-    timestamp = str(int(time.time()))
-    args = {"timestamp": timestamp}
-    json_str = json.dumps(args, separators=(",", ":"), sort_keys=True)
-    signature = wallet.sign(json_str.encode("utf-8"))
-    address = get_address_from_public_key(wallet.get_public_key())
-
-    return {
+    now = int(time.time())
+    cache_key = (wallet.public_key_bytes(), recoverable)
+    if cache_ttl > 0 and not refresh:
+        with _header_cache_lock:
+            cached = _header_cache.get(cache_key)
+        if cached is not None and now - cached[0] < cache_ttl:
+            return dict(cached[1])
+
+    timestamp = str(now)
+    # Canonical JSON of {"timestamp": timestamp}; the value is all digits, so
+    # it needs no escaping and can be formatted directly.
+    message = b'{"timestamp":"%s"}' % timestamp.encode("ascii")
+    if recoverable:
+        signature = wallet.sign_recoverable(message)
+    else:
+        signature = wallet.sign(message)
+    address = wallet.get_key_address()
+
+    headers = {
         "X-Wallet-Address": address,
         "X-Signature": signature,
-        "X-Message": json_str,
+        "X-Message": message.decode("ascii"),
         "X-Timestamp": timestamp,
     }
+    if cache_ttl > 0:
+        with _header_cache_lock:
+            if len(_header_cache) >= _HEADER_CACHE_MAX:
+                _header_cache.clear()
+            _header_cache[cache_key] = (now, headers)
+    return dict(headers)
 
 
 def verify_weil_signature(
@@ -66,15 +111,17 @@ def verify_weil_signature(
       1. Reject stale timestamps (anti-replay).
       2. Compute SHA256 of the raw message bytes — this is the digest that
          weil_wallet.sign() signs over.
-      3. Decode the 64-byte compact signature (r || s).
+      3. Decode the compact signature: 64 bytes (r || s), or 65 bytes
+         (r || s || v) when the signer appended the recovery id.
       4. Recover the secp256k1 public key from (signature, digest).
-         The compact format carries no recovery-id, so we try 0 and 1.
+         With a recovery id this is a single recovery; a bare 64-byte
+         signature carries none, so we try 0 and 1.
       5. Derive the address from the recovered key and compare with
          X-Wallet-Address.
 
     Args:
         wallet_address: X-Wallet-Address header value.
-        signature_hex:  X-Signature header value (hex of 64 compact bytes).
+        signature_hex:  X-Signature header value (hex of 64 or 65 compact bytes).
         message:        X-Message header value (the JSON string that was signed).
         timestamp:      X-Timestamp header value (Unix seconds, as string).
         max_age_seconds: Maximum tolerated age of the timestamp. Defaults to
@@ -94,28 +141,43 @@ def verify_weil_signature(
     # 2. SHA256 of the message — mirrors hash_sha256(verify_payload.as_bytes())
     digest = hashlib.sha256(message.encode("utf-8")).digest()
 
-    # 3. Decode compact 64-byte signature (r || s)
+    # 3. Decode compact signature (r || s [|| v])
     try:
         sig_bytes = bytes.fromhex(signature_hex)
     except ValueError:
         return False
-    if len(sig_bytes) != 64:
+    if len(sig_bytes) == 65:
+        # Recovery id supplied by the signer: one recovery, no guessing.
+        candidates = (sig_bytes,)
+    elif len(sig_bytes) == 64:
+        # v is the recovery id. We try 0 and 1 (2/3 are valid only for edge-case keys).
+        candidates = (sig_bytes + b"\x00", sig_bytes + b"\x01")
+    else:
+        return False
+
+    # Compare raw 32-byte digests rather than hex strings. fromhex skips
+    # whitespace, so also require exactly 64 hex characters.
+    if not isinstance(wallet_address, str) or len(wallet_address) != 64:
+        return False
+    try:
+        target = bytes.fromhex(wallet_address)
+    except ValueError:
+        return False
+    if len(target) != 32:
         return False
 
     # 4 + 5. Recover public key and check address.
     # coincurve expects a 65-byte recoverable signature: r(32) || s(32) || v(1)
-    # v is the recovery id. We try 0 and 1 (2/3 are valid only for edge-case keys).
-    for recovery_id in (0, 1):
+    for recoverable_sig in candidates:
         try:
-            recoverable_sig = sig_bytes + bytes([recovery_id])
             pub = coincurve.PublicKey.from_signature_and_message(
                 recoverable_sig,
                 digest,
                 hasher=None,  # digest is already SHA256-hashed; don't hash again
             )
             # SHA256 of uncompressed key mirrors get_address_from_public_key()
-            derived = hashlib.sha256(pub.format(compressed=False)).hexdigest()
-            if derived == wallet_address.lower():
+            derived = hashlib.sha256(pub.format(compressed=False)).digest()
+            if derived == target:
                 return True
         except Exception:
             continue
@@ -0,0 +1,58 @@
+"""Process-wide HTTP clients for talking to Sentinel.
+
+Every :class:`~weil_wallet.WeilClient` normally opens its own connection
+pool. Long-running servers and tools that build several clients can pass
+``http_client=shared_http_client(host)`` instead, so all of them reuse one
+keep-alive pool (and its TLS sessions) per Sentinel host.
+
+The shared clients are bound to the event loop they are first used on; do
+not share them across separate ``asyncio.run()`` calls.
+
+Each pool is sized like the one a WeilClient opens for itself at
+``DEFAULT_CONCURRENCY``: that many keep-alive connections and twice that in
+total, room for ``DEFAULT_CONCURRENCY`` in-flight requests plus as many open
+streams. Clients on a shared pool do not share their concurrency limits, so
+keep their combined load within that (``WeilClient.with_wallet`` shares one
+limit between clients), or requests beyond it wait and may raise
+``httpx.PoolTimeout``.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+from weil_wallet.constants import DEFAULT_CONCURRENCY, SENTINEL_HOST
+
+_shared_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def shared_http_client(sentinel_host: Optional[str] = None) -> httpx.AsyncClient:
+    """Return the process-wide ``httpx.AsyncClient`` for *sentinel_host*.
+
+    Args:
+        sentinel_host: Base URL of the Sentinel node. Defaults to
+                       ``SENTINEL_HOST``.
+    """
+    base_url = (sentinel_host or SENTINEL_HOST).rstrip("/")
+    client = _shared_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=DEFAULT_CONCURRENCY,
+                max_connections=DEFAULT_CONCURRENCY * 2,
+            ),
+        )
+        _shared_clients[base_url] = client
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close every shared client. Call once on shutdown."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.aclose()
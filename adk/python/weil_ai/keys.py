@@ -0,0 +1,59 @@
+"""Private key discovery for scripts and examples.
+
+``locate_key()`` finds the ``private_key.wc`` file used to build a
+:class:`~weil_wallet.Wallet`. Set ``WEIL_PRIVATE_KEY`` to an explicit path to
+skip the search entirely (e.g. in deployments).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import stat
+from typing import Optional
+
+KEY_FILE_NAME = "private_key.wc"
+PRIVATE_KEY_ENV = "WEIL_PRIVATE_KEY"
+
+
+def _is_file(path: str) -> bool:
+    with contextlib.suppress(OSError):
+        return stat.S_ISREG(os.stat(path).st_mode)
+    return False
+
+
+@functools.cache
+def locate_key(script_dir: Optional[str] = None) -> str:
+    """Return the path of the private key file, resolved once per process.
+
+    Search order: ``$WEIL_PRIVATE_KEY``, then ``private_key.wc`` in
+    *script_dir*, the current working directory, and the parent of
+    *script_dir*.
+
+    Args:
+        script_dir: Directory of the calling script. When omitted only the
+                    environment variable and the cwd are checked.
+
+    Raises:
+        FileNotFoundError: If no candidate file exists.
+    """
+    env_path = os.environ.get(PRIVATE_KEY_ENV)
+    if env_path:
+        return env_path
+
+    candidates = [KEY_FILE_NAME]
+    if script_dir is not None:
+        candidates = [
+            os.path.join(script_dir, KEY_FILE_NAME),
+            KEY_FILE_NAME,
+            os.path.join(os.path.dirname(script_dir), KEY_FILE_NAME),
+        ]
+
+    for candidate in candidates:
+        if _is_file(candidate):
+            return candidate
+    raise FileNotFoundError(
+        f"{KEY_FILE_NAME} not found. Place it in examples/, python/, or cwd, "
+        f"or set {PRIVATE_KEY_ENV}."
+    )
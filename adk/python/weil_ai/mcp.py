@@ -3,26 +3,39 @@
 Provides:
 - ``secured(svc_name)``   — decorator factory that enforces on-chain access control
                             for FastMCP / MCP tool handlers.
-- ``weil_middleware()``   — Starlette middleware that reads the ``weil-wallet-addr``
-                            request header and stores it in a ContextVar.
+- ``weil_middleware()``   — ASGI middleware that verifies the wallet auth headers
+                            and stores the wallet address in a ContextVar.
 - ``current_wallet_addr()`` — read the wallet address set by the middleware for the
                               current request.
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import functools
-import json
-from typing import Any, Callable, Type
-import httpx
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Type
+
+import orjson
+
+try:
+    import mcp.types as mcp_types
+except ImportError:  # only needed by secured()
+    mcp_types = None
 from weil_wallet.api.platform_api import PlatformApi
+from weil_wallet.api.request import UserTransaction
 from weil_wallet.client import WeilClient
 from weil_wallet.constants import SENTINEL_HOST
+from weil_wallet.contract import ContractId
 from weil_wallet.errors import WalletNotPermittedError
 from weil_wallet.transaction import BaseTransaction, TransactionHeader
 from weil_wallet.utils import current_time_millis
 from .auth import verify_weil_signature
+from .http import shared_http_client
 
 # One ContextVar object per process, but its *value* is per-asyncio-task.
 # ASGI servers (uvicorn) run each HTTP request in a separate asyncio task, so
@@ -42,6 +55,77 @@ _weil_wallet_addr: contextvars.ContextVar[str] = contextvars.ContextVar(
 # more than 5 minutes after they were issued.
 _ALLOWED_TIMESTAMP_DRIFT: int = 300  # 5 minutes
 
+# How long secured() trusts a resolved service-name -> ContractId mapping
+# before asking Sentinel again (picks up applet redeploys).
+_APPLET_ID_TTL: float = 300.0  # 5 minutes
+
+# key_has_purpose results, keyed by (wallet_addr, svc_name) -> (expires_at,
+# allowed). Grants are reused for WEIL_PERM_CACHE_TTL seconds (default 30;
+# 0 disables the cache); denials expire sooner so a newly granted wallet is
+# let in quickly.
+_PERM_CACHE_TTL: float = float(os.environ.get("WEIL_PERM_CACHE_TTL", "30"))
+_PERM_CACHE_DENY_TTL: float = min(_PERM_CACHE_TTL, 5.0)
+_PERM_CACHE_MAX: int = 1024
+_perm_cache: "OrderedDict[tuple[str, str], tuple[float, bool]]" = OrderedDict()
+_perm_cache_lock = threading.Lock()
+
+
+def _perm_cache_get(wallet_addr: str, svc_name: str) -> Optional[bool]:
+    """Return the cached permission decision, or None on a miss/expiry."""
+    if _PERM_CACHE_TTL <= 0:
+        return None
+    key = (wallet_addr, svc_name)
+    with _perm_cache_lock:
+        entry = _perm_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _perm_cache[key]
+            return None
+        _perm_cache.move_to_end(key)
+        return entry[1]
+
+
+def _perm_cache_put(wallet_addr: str, svc_name: str, allowed: bool) -> None:
+    if _PERM_CACHE_TTL <= 0:
+        return
+    ttl = _PERM_CACHE_TTL if allowed else _PERM_CACHE_DENY_TTL
+    key = (wallet_addr, svc_name)
+    with _perm_cache_lock:
+        _perm_cache[key] = (time.monotonic() + ttl, allowed)
+        _perm_cache.move_to_end(key)
+        if len(_perm_cache) > _PERM_CACHE_MAX:
+            _perm_cache.popitem(last=False)
+
+
+# Permission checks currently on the wire, keyed like _perm_cache. Concurrent
+# tool calls from one wallet share a single key_has_purpose round-trip.
+_perm_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+
+async def _check_permission_coalesced(
+    wallet_addr: str,
+    svc_name: str,
+    check: Callable[[str], Any],
+) -> bool:
+    """Run ``check(wallet_addr)`` once for all concurrent callers and cache the result."""
+    key = (wallet_addr, svc_name)
+    loop = asyncio.get_running_loop()
+    task = _perm_inflight.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(check(wallet_addr))
+        _perm_inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if _perm_inflight.get(key) is t:
+                del _perm_inflight[key]
+            if not t.cancelled() and t.exception() is None:
+                _perm_cache_put(wallet_addr, svc_name, t.result())
+
+        task.add_done_callback(_done)
+    # Shielded so one caller being cancelled does not fail the others.
+    return await asyncio.shield(task)
+
 
 def current_wallet_addr() -> str:
     """Return the wallet address injected by the current request's middleware.
@@ -51,14 +135,77 @@ def current_wallet_addr() -> str:
     return _weil_wallet_addr.get()
 
 
+# ASGI header names are lower-cased bytes.
+_AUTH_HEADER_NAMES = frozenset(
+    (b"x-wallet-address", b"x-signature", b"x-message", b"x-timestamp")
+)
+
+_UNAUTHORIZED_BODY = b"Wallet address verification failed"
+
+# key_has_purpose answers with string booleans; anything else is a denial.
+_PURPOSE_FLAGS: dict[str, bool] = {"true": True, "false": False}
+
+# Successful header verifications, keyed by the full (signature, address,
+# message, timestamp) tuple -> wall-clock expiry. MCP sessions resend the same
+# headers on every POST, so repeats become a dict hit instead of a key
+# recovery. Entries expire with the timestamp window and after at most
+# _VERIFY_CACHE_TTL seconds.
+_VERIFY_CACHE_TTL: float = 60.0
+_VERIFY_CACHE_MAX: int = 4096
+_verify_cache: "OrderedDict[tuple[str, str, str, str], float]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def _verify_headers_cached(
+    wallet_address: str, signature_hex: str, message: str, timestamp: str
+) -> bool:
+    """verify_weil_signature() with a short-lived cache of successful results."""
+    key = (signature_hex, wallet_address, message, timestamp)
+    now = time.time()
+    with _verify_cache_lock:
+        expires_at = _verify_cache.get(key)
+        if expires_at is not None:
+            if expires_at > now:
+                _verify_cache.move_to_end(key)
+                return True
+            del _verify_cache[key]
+
+    if not verify_weil_signature(wallet_address, signature_hex, message, timestamp):
+        return False
+
+    expires_at = min(int(timestamp) + _ALLOWED_TIMESTAMP_DRIFT, now + _VERIFY_CACHE_TTL)
+    with _verify_cache_lock:
+        _verify_cache[key] = expires_at
+        _verify_cache.move_to_end(key)
+        if len(_verify_cache) > _VERIFY_CACHE_MAX:
+            _verify_cache.popitem(last=False)
+    return True
+
+
+async def _send_unauthorized(send: Any) -> None:
+    """Send a bare 401 text response over ASGI."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": _UNAUTHORIZED_BODY})
+
+
 def weil_middleware() -> Type[Any]:
-    """Return a Starlette middleware class that verifies wallet ownership on every
+    """Return an ASGI middleware class that verifies wallet ownership on every
     request and stores the verified address in a ContextVar.
 
     Expected request headers
     ------------------------
     X-Wallet-Address  : hex-encoded wallet address (SHA-256 of uncompressed pubkey)
-    X-Signature       : hex-encoded 64-byte compact secp256k1 signature (r‖s)
+    X-Signature       : hex-encoded 64-byte compact secp256k1 signature (r‖s),
+                        or 65 bytes (r‖s‖v) when the recovery id is appended
     X-Message         : canonical JSON string that was signed
     X-Timestamp       : Unix timestamp (seconds) when the request was created
 
@@ -70,45 +217,62 @@ def weil_middleware() -> Type[Any]:
     On success the verified checksum address is stored in the ContextVar and
     is readable via ``current_wallet_addr()`` for the lifetime of the request.
 
+    The class is plain ASGI, so it works with Starlette's ``add_middleware``
+    without depending on ``BaseHTTPMiddleware``.
+
     Usage::
 
         app = mcp.http_app(transport="streamable-http")
         app.add_middleware(weil_middleware())
     """
-    try:
-        from starlette.middleware.base import BaseHTTPMiddleware
-        from starlette.responses import Response
-    except ImportError as exc:
-        raise ImportError(
-            "starlette is required for weil_middleware(); "
-            "install it with: pip install starlette"
-        ) from exc
-
-    class WeilHeaderMiddleware(BaseHTTPMiddleware):
-        """Verifies wallet ownership via signature and stores the address in a ContextVar."""
-
-        async def dispatch(self, request: Any, call_next: Any) -> Any:
+    class WeilHeaderMiddleware:
+        """Verifies wallet ownership via signature and stores the address in a ContextVar.
+
+        Plain ASGI middleware: headers are read straight from the scope, so no
+        Request object, extra task or body stream is created per request.
+        """
+
+        def __init__(self, app: Any) -> None:
+            self.app = app
+
+        async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
             # Only verify auth for POST requests — those are the MCP tool calls.
             # GET /mcp establishes the SSE stream and never invokes a tool, so
             # it passes through without auth. weil_wallet_addr is only read
             # inside secured(), which only runs during POST-driven tool calls.
-            if request.method != "POST":
-                return await call_next(request)
-
-            wallet_address = request.headers.get("X-Wallet-Address")
-            signature_hex = request.headers.get("X-Signature")
-            message = request.headers.get("X-Message")
-            timestamp = request.headers.get("X-Timestamp")
-
-            is_verified = verify_weil_signature(
-                wallet_address, signature_hex, message, timestamp
+            if scope["type"] != "http" or scope["method"] != "POST":
+                await self.app(scope, receive, send)
+                return
+
+            headers = {}
+            for name, value in scope["headers"]:
+                if name in _AUTH_HEADER_NAMES:
+                    headers[name] = value.decode("latin-1")
+
+            wallet_address = headers.get(b"x-wallet-address")
+            if wallet_address is not None:
+                # Hex is case-insensitive; downstream keys use one spelling.
+                wallet_address = wallet_address.lower()
+            signature_hex = headers.get(b"x-signature")
+            message = headers.get(b"x-message")
+            timestamp = headers.get(b"x-timestamp")
+
+            is_verified = (
+                wallet_address is not None
+                and signature_hex is not None
+                and message is not None
+                and timestamp is not None
+                and _verify_headers_cached(
+                    wallet_address, signature_hex, message, timestamp
+                )
             )
 
             if not is_verified:
-                return Response("Wallet address verification failed", status_code=401)
+                await _send_unauthorized(send)
+                return
 
             _weil_wallet_addr.set(wallet_address)
-            return await call_next(request)
+            await self.app(scope, receive, send)
 
     return WeilHeaderMiddleware
 
@@ -120,6 +284,10 @@ def secured(svc_name: str) -> Callable:
     the wallet address extracted from the request header before invoking the tool.
     Returns an MCP error response (``isError=True``) when the wallet is not permitted.
 
+    Decisions are cached per (wallet, svc_name): grants for
+    ``WEIL_PERM_CACHE_TTL`` seconds (default 30), denials for at most 5 s.
+    Concurrent calls that miss the cache share one on-chain check.
+
     Usage::
 
         @server.tool()
@@ -128,28 +296,37 @@ def secured(svc_name: str) -> Callable:
             ...
     """
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            import mcp.types as mcp_types
-
-            def _permission_denied(wallet_addr: str) -> list:
-                # Build an MCP error content block so the client receives a
-                # structured, human-readable denial message instead of an
-                # unhandled exception.
-                msg = str(WalletNotPermittedError(wallet_addr, svc_name))
-                return [mcp_types.TextContent(type="text", text=msg, isError=True)]
+    if mcp_types is None:
+        raise ImportError("secured() requires the 'mcp' package: pip install mcp")
 
-            http_client = httpx.AsyncClient(
-                base_url=SENTINEL_HOST,
-                timeout=60.0,
-            )
+    def decorator(func: Callable) -> Callable:
+        # svc_name is fixed for this decorator, so its ContractId is resolved
+        # once and reused until _APPLET_ID_TTL expires.
+        applet_id_entry: tuple[float, ContractId] | None = None
+        applet_id_lock = asyncio.Lock()
+
+        async def resolve_applet_id(http_client: Any) -> ContractId:
+            nonlocal applet_id_entry
+            entry = applet_id_entry
+            if entry is not None and time.monotonic() - entry[0] < _APPLET_ID_TTL:
+                return entry[1]
+            async with applet_id_lock:
+                entry = applet_id_entry
+                if entry is not None and time.monotonic() - entry[0] < _APPLET_ID_TTL:
+                    return entry[1]
+                applet_id = await WeilClient.get_applet_id_for_name(
+                    http_client, svc_name
+                )
+                applet_id_entry = (time.monotonic(), applet_id)
+                return applet_id
+
+        async def check_permission(wallet_addr: str) -> bool:
+            """Ask the applet whether *wallet_addr* may call tools on svc_name."""
+            # Keep-alive pool shared by every secured tool; never closed here.
+            http_client = shared_http_client(SENTINEL_HOST)
             # Resolve the human-friendly service name (e.g. "engg.weil") to the
             # on-chain ContractId that owns the access-control list.
-            applet_id = await WeilClient.get_applet_id_for_name(http_client, svc_name)
-            # Wallet address was verified by weil_middleware() and stored in the
-            # ContextVar for this asyncio task; retrieve it here.
-            wallet_addr = current_wallet_addr()
+            applet_id = await resolve_applet_id(http_client)
 
             # For a read-only ``key_has_purpose`` call the sender and recipient
             # are both the caller's wallet address.
@@ -159,20 +336,23 @@ def secured(svc_name: str) -> Callable:
             method_name = "key_has_purpose"
             # Ask the contract whether this wallet holds the "Execution" purpose,
             # i.e. is it authorised to invoke tools on this service.
-            method_args = json.dumps({"key": wallet_addr, "purpose": "Execution"})
-
-            final_args = {
-                "contract_address": applet_id,
-                "contract_method": method_name,
-                "contract_input_bytes": method_args,
+            method_args = orjson.dumps(
+                {"key": wallet_addr, "purpose": "Execution"}
+            ).decode()
+
+            user_txn = UserTransaction(
+                ty="SmartContractExecutor",
+                contract_address=applet_id,
+                contract_method=method_name,
+                contract_input_bytes=method_args,
                 # Hide args from the transaction log to avoid leaking wallet
                 # addresses into public chain storage.
-                "should_hide_args": True,
-            }
+                should_hide_args=True,
+            )
 
             # Use current time (ms) as a monotonically increasing nonce to
             # prevent transaction replay at the chain level.
-            nonce = int(current_time_millis())
+            nonce = current_time_millis()
             header = TransactionHeader(
                 nonce=nonce,
                 public_key="",
@@ -182,7 +362,7 @@ def secured(svc_name: str) -> Callable:
             )
 
             base_txn = BaseTransaction(header=header)
-            payload = WeilClient._build_submit_payload("", base_txn, final_args)
+            payload = WeilClient._build_submit_payload("", base_txn, user_txn)
 
             # Submit the permission-check transaction synchronously (blocking=True)
             # so the access decision is available before the tool runs.
@@ -192,26 +372,36 @@ def secured(svc_name: str) -> Callable:
                 is_non_blocking=False,
             )
 
-            txn_result = json.loads(resp.txn_result)
+            txn_result = orjson.loads(resp.txn_result)
 
             # The chain returns {"Ok": "true"/"false"} on success or a different
             # top-level key on failure (e.g. {"Err": "..."}). Anything other than
-            # an explicit "Ok" key is treated as a denial.
-            if "Ok" not in txn_result:
-                return _permission_denied(wallet_addr)
+            # an explicit "Ok" key, or an unexpected flag, is treated as a denial.
+            if not isinstance(txn_result, dict):
+                return False
+            flag = txn_result.get("Ok")
+            return _PURPOSE_FLAGS.get(flag, False) if isinstance(flag, str) else False
 
-            flag = txn_result["Ok"]
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            def _permission_denied(wallet_addr: str) -> list:
+                # Build an MCP error content block so the client receives a
+                # structured, human-readable denial message instead of an
+                # unhandled exception.
+                msg = str(WalletNotPermittedError(wallet_addr, svc_name))
+                return [mcp_types.TextContent(type="text", text=msg, isError=True)]
 
-            # Normalise the string booleans returned by the smart contract.
-            if flag == "false":
-                flag = False
-            elif flag == "true":
-                flag = True
-            else:
-                # Unexpected value — deny access rather than allow by default.
-                return _permission_denied(wallet_addr)
+            # Wallet address was verified by weil_middleware() and stored in the
+            # ContextVar for this asyncio task; retrieve it here.
+            wallet_addr = current_wallet_addr()
+
+            allowed = _perm_cache_get(wallet_addr, svc_name)
+            if allowed is None:
+                allowed = await _check_permission_coalesced(
+                    wallet_addr, svc_name, check_permission
+                )
 
-            if not flag:
+            if not allowed:
                 return _permission_denied(wallet_addr)
 
             return await func(*args, **kwargs)
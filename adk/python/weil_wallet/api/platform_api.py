@@ -18,10 +18,14 @@ class PlatformApi:
         client: httpx.AsyncClient,
         *,
         is_non_blocking: bool,
+        stream: bool = False,
     ) -> httpx.Response:
-        """GZIP-compress and POST the transaction payload; raise on HTTP error."""
-        payload_dict = payload.to_payload_dict()
-        tx_payload = compress(payload_dict)
+        """GZIP-compress and POST the transaction payload; raise on HTTP error.
+
+        With ``stream=True`` the response is returned as soon as its headers
+        arrive and the caller must read and ``aclose()`` it.
+        """
+        tx_payload = compress(payload.to_payload_bytes())
 
         files = {
             "transaction": ("transaction_data", tx_payload, "application/octet-stream")
@@ -32,11 +36,15 @@ class PlatformApi:
         if is_non_blocking:
             headers["x-non-blocking"] = "true"
 
-        response = await client.post(
-            "/contracts/execute_smartcontract", files=files, headers=headers
+        request = client.build_request(
+            "POST", "/contracts/execute_smartcontract", files=files, headers=headers
         )
+        response = await client.send(request, stream=stream)
 
         if not response.is_success:
+            if stream:
+                await response.aread()
+                await response.aclose()
             body = response.text[:500] if response.text else ""
 
             raise RuntimeError(
@@ -59,6 +67,22 @@ class PlatformApi:
         data = response.json()
         return TransactionResult.from_dict(data)
 
+    @staticmethod
+    async def open_transaction_stream(
+        payload: SubmitTxnRequest,
+        client: httpx.AsyncClient,
+        *,
+        is_non_blocking: bool = False,
+    ) -> httpx.Response:
+        """Submit and return the response once its headers have arrived.
+
+        The body is left unread: iterate ``response.aiter_bytes()`` and close
+        it with ``await response.aclose()``.
+        """
+        return await PlatformApi._submit_transaction_inner(
+            payload, client, is_non_blocking=is_non_blocking, stream=True
+        )
+
     @staticmethod
     async def submit_transaction_with_streaming(
         payload: SubmitTxnRequest,
@@ -67,9 +91,12 @@ class PlatformApi:
         is_non_blocking: bool = False,
     ) -> AsyncIterator[bytes]:
         """Submit and return an async iterator of response body chunks."""
-        response = await PlatformApi._submit_transaction_inner(
+        response = await PlatformApi.open_transaction_stream(
             payload, client, is_non_blocking=is_non_blocking
         )
-        async for chunk in response.aiter_bytes():
-            if chunk:
-                yield chunk
+        try:
+            async for chunk in response.aiter_bytes():
+                if chunk:
+                    yield chunk
+        finally:
+            await response.aclose()
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import Any, Optional
 
+import orjson
+
 from ..contract import ContractId
 from ..transaction import TransactionHeader
 
@@ -69,3 +71,7 @@ class SubmitTxnRequest:
                 },
             }
         }
+
+    def to_payload_bytes(self) -> bytes:
+        """Encode the payload straight to compact JSON bytes (see to_payload_dict)."""
+        return orjson.dumps(self.to_payload_dict())
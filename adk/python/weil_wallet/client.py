@@ -5,6 +5,7 @@ import asyncio
 import functools
 import inspect
 import json
+import logging
 from typing import Any, AsyncIterator, Callable, Optional
 import httpx
 from .api.platform_api import PlatformApi
@@ -18,6 +19,140 @@ from .wallet import SelectedAccount, Wallet
 
 AUDIT_APPLET_SVC_NAME = "auditor"
 
+logger = logging.getLogger(__name__)
+
+# Canonical form of the signed execute payload: compact JSON, keys sorted at
+# every level (what json.dumps(..., sort_keys=True) produced). Values are
+# substituted already JSON-encoded.
+_EXECUTE_SIGNING_TEMPLATE = (
+    '{{"from_addr":{from_addr},"nonce":{nonce},"to_addr":{to_addr},'
+    '"user_txn":{{"contract_address":{contract_address},'
+    '"contract_input_bytes":{contract_input_bytes},'
+    '"contract_method":{contract_method},'
+    '"should_hide_args":{should_hide_args},'
+    '"type":"SmartContractExecutor"}}}}'
+)
+
+
+class _PrebuiltSigner:
+    """Signs execute calls of one (contract, method, should_hide_args).
+
+    Everything in the signed payload except the nonce and the input bytes is
+    fixed per signer (and per active account), so it is encoded once into a
+    head/middle/tail and each call only splices in those two values. Returned
+    by ``WeilContractClient.build_signer``.
+    """
+
+    __slots__ = (
+        "contract_client",
+        "method_name",
+        "should_hide_args",
+        "_tail",
+        "_account",
+        "_head",
+        "_middle",
+    )
+
+    def __init__(
+        self,
+        contract_client: "WeilContractClient",
+        method_name: str,
+        should_hide_args: bool,
+    ) -> None:
+        self.contract_client = contract_client
+        self.method_name = method_name
+        self.should_hide_args = should_hide_args
+        # Pieces are pre-encoded bytes (json.dumps output is ASCII), so each
+        # call only encodes the nonce and input and joins once.
+        self._tail = (
+            ',"contract_method":' + json.dumps(method_name)
+            + ',"should_hide_args":' + json.dumps(should_hide_args)
+            + ',"type":"SmartContractExecutor"}}'
+        ).encode("ascii")
+        self._account: Optional[tuple[str, str]] = None
+        self._head = b""
+        self._middle = b""
+
+    async def __call__(
+        self, method_args: str
+    ) -> tuple[BaseTransaction, str, UserTransaction]:
+        """Sign *method_args*; same result shape as ``_sign_and_construct_txn``."""
+        contract_client = self.contract_client
+        contract_id = contract_client._contract_id
+        client = contract_client._client
+        async with client._wallet_lock:
+            wallet = client._wallet
+            account = (wallet.get_address(), wallet.get_public_key_hex())
+            if account != self._account:
+                # First call, or set_account() switched the signing account.
+                from_addr = json.dumps(account[0])
+                self._head = ('{"from_addr":' + from_addr + ',"nonce":').encode("ascii")
+                self._middle = (
+                    ',"to_addr":' + from_addr
+                    + ',"user_txn":{"contract_address":' + json.dumps(str(contract_id))
+                    + ',"contract_input_bytes":'
+                ).encode("ascii")
+                self._account = account
+
+            nonce = current_time_millis()
+            signed = b"".join(
+                (
+                    self._head,
+                    b"%d" % nonce,
+                    self._middle,
+                    json.dumps(method_args).encode("ascii"),
+                    self._tail,
+                )
+            )
+            signature = wallet.sign(signed)
+
+        header = TransactionHeader(
+            nonce=nonce,
+            public_key=account[1],
+            from_addr=account[0],
+            to_addr=account[0],
+            signature=signature,
+            weilpod_counter=contract_id.pod_counter(),
+        )
+        user_txn = UserTransaction(
+            ty="SmartContractExecutor",
+            contract_address=contract_id,
+            contract_method=self.method_name,
+            contract_input_bytes=method_args,
+            should_hide_args=self.should_hide_args,
+        )
+        return BaseTransaction(header=header), signature, user_txn
+
+
+def _positional_param_names(func: Callable) -> list[str]:
+    """Names of *func*'s positional parameters, in order (no ``*args``)."""
+    target = inspect.unwrap(func)
+    code = getattr(target, "__code__", None)
+    if code is None:
+        # partials, callable objects, builtins: use the full machinery.
+        return [
+            name
+            for name, p in inspect.signature(func).parameters.items()
+            if p.kind
+            in (
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                inspect.Parameter.POSITIONAL_ONLY,
+            )
+        ]
+    names = list(code.co_varnames[: code.co_argcount])
+    if inspect.ismethod(target):
+        names = names[1:]  # bound: self/cls is never passed by the caller
+    return names
+
+
+def _log_audit_failure(task: asyncio.Task) -> None:
+    """Done callback for decorator audits: nothing awaits them, so log failures."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("audit submission failed", exc_info=exc)
+
 
 class WeilClient:
     """High-level client for WeilChain applet methods.
@@ -32,6 +167,7 @@ class WeilClient:
         *,
         sentinel_host: Optional[str] = "https://sentinel.unweil.me",
         verify: bool = True,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         """Create a WeilClient.
 
@@ -40,6 +176,9 @@ class WeilClient:
             concurrency: Max concurrent in-flight requests. Defaults to DEFAULT_CONCURRENCY.
             sentinel_host: Base URL of the Sentinel node. Defaults to the production endpoint.
             verify: Whether to verify TLS certificates (set False for self-signed certs).
+            http_client: Existing HTTP client to send requests through. The caller
+                keeps ownership: ``close()`` will not close it. When omitted a
+                new client is created for ``sentinel_host``.
         """
         self._wallet = wallet
         self._wallet_lock = asyncio.Lock()
@@ -47,14 +186,31 @@ class WeilClient:
             concurrency if concurrency is not None else DEFAULT_CONCURRENCY
         )
         self._semaphore = asyncio.Semaphore(self._concurrency)
+        # Open streaming responses, which hold a pool connection until closed.
+        self._stream_semaphore = asyncio.Semaphore(self._concurrency)
         self._sentinel_host = sentinel_host or SENTINEL_HOST
-        self._http_client = httpx.AsyncClient(
-            base_url=self._sentinel_host.rstrip("/"),
-            verify=verify,
-            timeout=60.0,
-        )
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            # One keep-alive slot per permitted in-flight request, so bursts
+            # up to the semaphore limit reuse warm connections instead of
+            # closing them and paying a new TLS handshake next time. The pool
+            # itself is twice that: up to concurrency open streams (each
+            # keeps its connection) plus concurrency in-flight requests.
+            http_client = httpx.AsyncClient(
+                base_url=self._sentinel_host.rstrip("/"),
+                verify=verify,
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self._concurrency,
+                    max_connections=self._concurrency * 2,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        self._http_client = http_client
         self._audit_contract_id: Optional[ContractId] = None
         self._audit_contract_id_lock = asyncio.Lock()
+        # Submissions started by the @audit() decorator that have not finished.
+        self._pending_audits: set[asyncio.Task] = set()
 
     @classmethod
     def from_account_export_file(
@@ -99,6 +255,40 @@ class WeilClient:
         wallet = Wallet.from_wallet_file(path)
         return cls(wallet, concurrency, sentinel_host=sentinel_host, verify=verify)
 
+    @classmethod
+    def from_shared_http(
+        cls,
+        http_client: httpx.AsyncClient,
+        wallet: Wallet,
+        *,
+        concurrency: Optional[int] = None,
+        sentinel_host: Optional[str] = None,
+    ) -> "WeilClient":
+        """Construct a WeilClient that sends through an externally managed HTTP client.
+
+        Lets many wallets (e.g. accounts of one ``MnemonicWallet``) share a
+        single connection pool. The caller owns *http_client*: ``close()`` on
+        the returned client leaves it open.
+
+        The caller also sizes it. Each client allows ``concurrency`` in-flight
+        requests plus ``concurrency`` open streams, and clients built this way
+        do not share those limits, so the pool's ``httpx.Limits`` must cover
+        their total (``2 * concurrency`` per client). Requests beyond the pool
+        size wait and may raise ``httpx.PoolTimeout``.
+
+        Args:
+            http_client:   Client whose ``base_url`` points at the Sentinel node.
+            wallet:        Signing wallet.
+            concurrency:   Max concurrent in-flight requests. Defaults to DEFAULT_CONCURRENCY.
+            sentinel_host: Recorded Sentinel URL; defaults to ``http_client.base_url``.
+        """
+        return cls(
+            wallet,
+            concurrency,
+            sentinel_host=sentinel_host or str(http_client.base_url),
+            http_client=http_client,
+        )
+
     async def add_account_from_export_file(self, path: str) -> None:
         """Append an additional account from a sentinel account export file.
 
@@ -125,6 +315,25 @@ class WeilClient:
         async with self._wallet_lock:
             self._wallet.set_index(selected)
 
+    def with_wallet(self, wallet: Wallet) -> "WeilClient":
+        """Return a client that signs with *wallet* over this client's connection.
+
+        The new client shares the HTTP connection pool, the concurrency limit
+        and the resolved audit applet address, so switching between many
+        wallets does not pay a new TLS handshake each time. Closing it leaves
+        the shared connection open; close the original client instead.
+        """
+        client = WeilClient(
+            wallet,
+            self._concurrency,
+            sentinel_host=self._sentinel_host,
+            http_client=self._http_client,
+        )
+        client._semaphore = self._semaphore
+        client._stream_semaphore = self._stream_semaphore
+        client._audit_contract_id = self._audit_contract_id
+        return client
+
     def to_contract_client(self, contract_id: ContractId) -> "WeilContractClient":
         """Create a WeilContractClient bound to a specific ContractId."""
         return WeilContractClient(contract_id=contract_id, client=self)
@@ -187,6 +396,9 @@ class WeilClient:
 
     async def _get_audit_contract_id(self) -> ContractId:
         """Resolve and cache the audit applet contract address from the Sentinel API."""
+        # Fast path once resolved; the lock only serializes the first lookup.
+        if self._audit_contract_id is not None:
+            return self._audit_contract_id
         async with self._audit_contract_id_lock:
             if self._audit_contract_id is not None:
                 return self._audit_contract_id
@@ -214,29 +426,31 @@ class WeilClient:
         """Submit an audit log entry, or use as a decorator factory.
 
         Direct call:   await client.audit("log string")
-        Decorator:     @client.audit()   — prepends two lines to the wrapped
-                       function: builds a JSON entry from all arguments, then
-                       calls client._submit_audit(entry) before the handler runs.
+        Decorator:     @client.audit()   — builds a JSON entry from all arguments
+                       and starts submitting it before the handler runs. The
+                       handler does not wait for the submission (it is sent
+                       non-blocking anyway); close() waits for any still pending.
+
+        The decorator fails open: the handler runs even if its audit submission
+        fails, and the failure is logged on the ``weil_wallet.client`` logger
+        rather than raised. Use the direct call to make a handler depend on a
+        successful audit.
         """
         if log is not None:
             return self._submit_audit(log)
 
         def decorator(func: Callable) -> Callable:
-            sig = inspect.signature(func)
-            positional_params = [
-                name
-                for name, p in sig.parameters.items()
-                if p.kind
-                in (
-                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    inspect.Parameter.POSITIONAL_ONLY,
-                )
-            ]
+            positional_params = _positional_param_names(func)
 
             @functools.wraps(func)
             async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                # json.dumps, not orjson: the entry is stored on-chain and
+                # keeps its established format (", " separators, ASCII escapes).
                 entry = json.dumps(dict(zip(positional_params, args)) | kwargs)
-                await self._submit_audit(entry)
+                task = asyncio.create_task(self._submit_audit(entry))
+                self._pending_audits.add(task)
+                task.add_done_callback(self._pending_audits.discard)
+                task.add_done_callback(_log_audit_failure)
                 return await func(*args, **kwargs)
 
             return wrapper
@@ -244,8 +458,12 @@ class WeilClient:
         return decorator
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._http_client.aclose()
+        """Flush pending decorator audits, then close the HTTP client unless
+        it was supplied by the caller."""
+        if self._pending_audits:
+            await asyncio.gather(*self._pending_audits, return_exceptions=True)
+        if self._owns_http_client:
+            await self._http_client.aclose()
 
     async def __aenter__(self) -> "WeilClient":
         """Enter async context: pre-resolve the audit applet address."""
@@ -260,9 +478,9 @@ class WeilClient:
     def _build_submit_payload(
         signature: str,
         base_txn: BaseTransaction,
-        args: dict[str, Any],
+        user_txn: UserTransaction,
     ) -> SubmitTxnRequest:
-        """Build the SubmitTxnRequest with fresh creation_time."""
+        """Build the SubmitTxnRequest around *user_txn* with fresh creation_time."""
         h = base_txn.header
         req_header = TransactionHeader(
             nonce=h.nonce,
@@ -271,14 +489,7 @@ class WeilClient:
             to_addr=h.to_addr,
             signature=signature,
             weilpod_counter=h.weilpod_counter,
-            creation_time=int(current_time_millis()),
-        )
-        user_txn = UserTransaction(
-            ty="SmartContractExecutor",
-            contract_address=args["contract_address"],
-            contract_method=args["contract_method"],
-            contract_input_bytes=args["contract_input_bytes"],
-            should_hide_args=args["should_hide_args"],
+            creation_time=current_time_millis(),
         )
         txn = Transaction(
             is_xpod=False,
@@ -308,8 +519,8 @@ class WeilContractClient:
 
     async def _sign_and_construct_txn(
         self, method_name: str, method_args: str, should_hide_args: bool
-    ) -> tuple[BaseTransaction, str, dict]:
-        """Build, sign, and return (base_txn, hex_signature, args_dict).
+    ) -> tuple[BaseTransaction, str, UserTransaction]:
+        """Build, sign, and return (base_txn, hex_signature, user_txn).
 
         Acquires the wallet lock, derives the public key and address from the
         active account, builds a TransactionHeader with a timestamp-based nonce,
@@ -321,24 +532,26 @@ class WeilContractClient:
             should_hide_args: When True the arguments are encrypted server-side.
 
         Returns:
-            A 3-tuple of (BaseTransaction, hex signature string, args dict).
+            A 3-tuple of (BaseTransaction, hex signature string, UserTransaction).
         """
         async with self._client._wallet_lock:
-            public_key = self._client._wallet.get_public_key()
-            from_addr = self._client._wallet.get_address()
+            wallet = self._client._wallet
+            from_addr = wallet.get_address()
             to_addr = from_addr
             weilpod_counter = self._contract_id.pod_counter()
             # Rust uses full (uncompressed) for on-wire; parsed_public_key expects Full
-            public_key_hex = public_key.format(compressed=False).hex()
-
-            args = {
-                "contract_address": self._contract_id,
-                "contract_method": method_name,
-                "contract_input_bytes": method_args,
-                "should_hide_args": should_hide_args,
-            }
+            public_key_hex = wallet.get_public_key_hex()
+
+            # Built once: signed below and submitted as-is.
+            user_txn = UserTransaction(
+                ty="SmartContractExecutor",
+                contract_address=self._contract_id,
+                contract_method=method_name,
+                contract_input_bytes=method_args,
+                should_hide_args=should_hide_args,
+            )
 
-            nonce = int(current_time_millis())
+            nonce = current_time_millis()
             header = TransactionHeader(
                 nonce=nonce,
                 public_key=public_key_hex,
@@ -347,73 +560,55 @@ class WeilContractClient:
                 weilpod_counter=weilpod_counter,
             )
 
-            signature = self._sign_execute_args(header, args)
+            signature = self._sign_execute_args(header, user_txn)
             header.set_signature(signature)
 
             base_txn = BaseTransaction(header=header)
-            return base_txn, signature, args
-        weilpod_counter = self._contract_id.pod_counter()
-        # Rust uses full (uncompressed) for on-wire; parsed_public_key expects Full
-        public_key_hex = public_key.format(compressed=False).hex()
-
-        args = {
-            "contract_address": self._contract_id,
-            "contract_method": method_name,
-            "contract_input_bytes": method_args,
-            "should_hide_args": should_hide_args,
-        }
-
-        nonce = int(current_time_millis())
-        header = TransactionHeader(
-            nonce=nonce,
-            public_key=public_key_hex,
-            from_addr=from_addr,
-            to_addr=to_addr,
-            weilpod_counter=weilpod_counter,
-        )
-
-        signature = self._sign_execute_args(header, args)
-        header.set_signature(signature)
-
-        base_txn = BaseTransaction(header=header)
-        return base_txn, signature, args
+            return base_txn, signature, user_txn
 
     def _sign_execute_args(
-        self, txn_header: TransactionHeader, args: dict[str, Any]
+        self, txn_header: TransactionHeader, user_txn: UserTransaction
     ) -> str:
         """Canonicalize and sign the execute payload.
 
-        Match Rust: value_to_btreemap sorts only top-level keys; inner
-        user_txn keeps json! insertion order (type, contract_address,
-        contract_method, contract_input_bytes). Use same order so signature
-        verifies on the server.
+        The signed bytes are the execute payload as compact JSON with keys
+        sorted at every level, which is what the server verifies. The key
+        order is fixed, so it lives in _EXECUTE_SIGNING_TEMPLATE and only the
+        values are encoded here.
         """
-        user_txn = {
-            "type": "SmartContractExecutor",
-            "contract_address": str(args["contract_address"]),
-            "contract_method": args["contract_method"],
-            "contract_input_bytes": args["contract_input_bytes"],
-            "should_hide_args": args["should_hide_args"],
-        }
-        payload = {
-            "from_addr": txn_header.from_addr,
-            "nonce": txn_header.nonce,
-            "to_addr": txn_header.to_addr,
-            "user_txn": user_txn,
-        }
-        # Top-level sorted; use sort_keys=True so inner user_txn is also sorted
-        # (server may canonicalize the same way when verifying)
-        canonical = dict(sorted(payload.items()))
-        json_str = json.dumps(canonical, separators=(",", ":"), sort_keys=True)
+        dumps = json.dumps
+        json_str = _EXECUTE_SIGNING_TEMPLATE.format(
+            from_addr=dumps(txn_header.from_addr),
+            nonce=dumps(txn_header.nonce),
+            to_addr=dumps(txn_header.to_addr),
+            contract_address=dumps(str(user_txn.contract_address)),
+            contract_input_bytes=dumps(user_txn.contract_input_bytes),
+            contract_method=dumps(user_txn.contract_method),
+            should_hide_args=dumps(user_txn.should_hide_args),
+        )
         # Caller holds _wallet_lock.
         return self._client._wallet.sign(json_str.encode("utf-8"))
 
+    def build_signer(
+        self, method_name: str, should_hide_args: bool = True
+    ) -> _PrebuiltSigner:
+        """Return a signer specialized for repeated calls of *method_name*.
+
+        Pass it to ``execute(..., signer=...)`` in tight loops that call the
+        same method: the constant part of the signed payload is encoded once
+        instead of on every call. The signer follows account switches made
+        with ``WeilClient.set_account``.
+        """
+        return _PrebuiltSigner(self, method_name, should_hide_args)
+
     async def execute(
         self,
         method_name: str,
         method_args: str,
         should_hide_args: bool = True,
         is_non_blocking: bool = False,
+        *,
+        signer: Optional[_PrebuiltSigner] = None,
     ) -> TransactionResult:
         """Execute an exported applet method and return the transaction result.
 
@@ -426,14 +621,32 @@ class WeilContractClient:
             should_hide_args: When True the arguments are encrypted before submission.
             is_non_blocking:  When True the platform responds immediately without
                               waiting for transaction finalization.
+            signer:           Optional signer from ``build_signer`` on this client
+                              for the same method and ``should_hide_args``.
 
         Returns:
             TransactionResult with status, block height, and application result.
         """
-        base_txn, signature, args = await self._sign_and_construct_txn(
-            method_name, method_args, should_hide_args
-        )
-        payload = WeilClient._build_submit_payload(signature, base_txn, args)
+        if signer is None:
+            base_txn, signature, user_txn = await self._sign_and_construct_txn(
+                method_name, method_args, should_hide_args
+            )
+        else:
+            if signer.contract_client._client is not self._client:
+                # Another WeilClient (e.g. from with_wallet) signs with its own wallet.
+                raise ValueError("signer was built from a different WeilClient")
+            if (
+                signer.method_name != method_name
+                or signer.should_hide_args != should_hide_args
+                or signer.contract_client._contract_id != self._contract_id
+            ):
+                raise ValueError(
+                    f"signer was built for {signer.method_name!r} "
+                    f"(should_hide_args={signer.should_hide_args}) on "
+                    f"{signer.contract_client._contract_id}"
+                )
+            base_txn, signature, user_txn = await signer(method_args)
+        payload = WeilClient._build_submit_payload(signature, base_txn, user_txn)
 
         async with self._client._semaphore:
             return await PlatformApi.submit_transaction(
@@ -450,6 +663,11 @@ class WeilContractClient:
         Suitable for methods that produce incremental output (e.g. LLM inference).
         Iterate the returned ByteStream with ``async for chunk in stream``.
 
+        An open stream uses one pool connection until it is exhausted or
+        closed. At most ``concurrency`` streams are open per client at a time;
+        further streams wait for one to finish, so open streams never take
+        every connection from ``execute``.
+
         Args:
             method_name: The exported method to invoke.
             method_args: JSON-encoded argument payload.
@@ -457,16 +675,25 @@ class WeilContractClient:
         Returns:
             ByteStream that yields ``bytes`` chunks as they arrive.
         """
-        base_txn, signature, args = await self._sign_and_construct_txn(
+        base_txn, signature, user_txn = await self._sign_and_construct_txn(
             method_name, method_args, False
         )
-        payload = WeilClient._build_submit_payload(signature, base_txn, args)
+        payload = WeilClient._build_submit_payload(signature, base_txn, user_txn)
 
         async def stream() -> AsyncIterator[bytes]:
-            async with self._client._semaphore:
-                async for chunk in PlatformApi.submit_transaction_with_streaming(
-                    payload, self._client._http_client, is_non_blocking=False
-                ):
-                    yield chunk
+            # The stream slot is held for the stream's lifetime, since the
+            # response keeps its connection; the request slot only covers
+            # sending the transaction and waiting for the response headers.
+            async with self._client._stream_semaphore:
+                async with self._client._semaphore:
+                    response = await PlatformApi.open_transaction_stream(
+                        payload, self._client._http_client, is_non_blocking=False
+                    )
+                try:
+                    async for chunk in response.aiter_bytes():
+                        if chunk:
+                            yield chunk
+                finally:
+                    await response.aclose()
 
         return ByteStream(stream())
@@ -1,46 +1,59 @@
 """Contract ID (Weil Applet address) and pod routing."""
 
 import base64
-import struct
+
 from .errors import InvalidContractIdError
 
 
+def _decode_pod_counter(value: str) -> int:
+    """Decode the pod counter from a contract ID string (see ContractId.pod_counter)."""
+    # Python base64.b32decode expects uppercase; add padding if needed
+    pad = (8 - len(value) % 8) % 8
+    try:
+        decoded = base64.b32decode(value.upper() + "=" * pad)
+    except Exception as e:
+        raise ValueError("base32 decoding failed") from e
+    if len(decoded) != 36:
+        raise ValueError(
+            f"expected 36 bytes long, got {len(decoded)} bytes"
+        )
+    return int.from_bytes(decoded[:4], "big", signed=True)
+
+
 class ContractId:
     """Contract ID (contract address) of a Weil Applet (smart contract)."""
 
-    __slots__ = ("_value",)
+    __slots__ = ("_value", "_pod_counter", "_hash")
 
     def __init__(self, contract_id: str) -> None:
-        self._value = self._validate(contract_id)
+        """Validate and decode *contract_id* once.
+
+        The ID must be unpadded base32 of exactly 36 bytes; anything else raises
+        InvalidContractIdError here rather than on first use.
+        """
+        if not isinstance(contract_id, str):
+            raise InvalidContractIdError(
+                f"expected str, got {type(contract_id).__name__}"
+            )
+        try:
+            self._pod_counter = _decode_pod_counter(contract_id)
+        except ValueError as e:
+            raise InvalidContractIdError(str(e)) from e
+        self._value = contract_id
+        self._hash = hash(contract_id)
 
     @classmethod
     def new(cls, contract_id: str) -> "ContractId":
         """Construct from a string. Raises InvalidContractIdError if invalid."""
         return cls(contract_id)
 
-    def _validate(self, s: str) -> str:
-        """Validate contract ID string. Returns trimmed value."""
-        # Rust has validate_contract_id_str as TODO (no-op); we do the same.
-        return s
-
     def pod_counter(self) -> int:
         """Extract WeilPod (shard) counter from the contract ID for routing.
 
         Decodes base32 (RFC 4648 lower, no padding), expects 36 bytes,
-        first 4 bytes big-endian as i32.
+        first 4 bytes big-endian as i32. Decoded once, at construction.
         """
-        # Python base64.b32decode expects uppercase; add padding if needed
-        pad = (8 - len(self._value) % 8) % 8
-        try:
-            decoded = base64.b32decode(self._value.upper() + "=" * pad)
-        except Exception as e:
-            raise ValueError("base32 decoding failed") from e
-        if len(decoded) != 36:
-            raise ValueError(
-                f"invalid contract-id: expected 36 bytes long, got {len(decoded)} bytes"
-            )
-        (pod_id_counter,) = struct.unpack(">i", decoded[:4])
-        return pod_id_counter
+        return self._pod_counter
 
     def __str__(self) -> str:
         return self._value
@@ -54,12 +67,14 @@ class ContractId:
         return False
 
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 def contract_id_from_str(s: str) -> ContractId:
     """Parse a contract ID from string. Raises InvalidContractIdError on failure."""
     try:
         return ContractId(s)
+    except InvalidContractIdError:
+        raise
     except Exception as e:
         raise InvalidContractIdError(str(e)) from e
@@ -5,11 +5,13 @@ derivation path : m/44'/9345'/0'/0 with account index.
 """
 
 import base64
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Union
 
+import orjson
 from bip_utils import (
     Bip32Slip10Secp256k1,
     Bip39MnemonicGenerator,
@@ -21,6 +23,15 @@ from .wallet import PrivateKey, Wallet
 
 DERIVATION_PATH = "m/44'/9345'/0'/0"
 _STORED_WALLET_VERSION = 1
+# One derivation takes well under a millisecond (bip_utils uses coincurve), so
+# a process pool only pays for its start-up on batches of thousands.
+_PARALLEL_DERIVE_MIN = 2048
+
+
+try:
+    from eth_hash.auto import keccak as _keccak
+except ImportError:  # reported on first use, so plain wallets still import
+    _keccak = None
 
 
 def _keccak256(data: bytes) -> bytes:
@@ -31,8 +42,11 @@ def _keccak256(data: bytes) -> bytes:
     final padding and produces different output, which would silently produce
     wrong wallet addresses.
     """
-    from eth_hash.auto import keccak  # ImportError if eth_hash not installed
-    return keccak(data)
+    if _keccak is None:
+        raise ImportError(
+            "derived accounts need eth_hash: pip install 'eth-hash[pycryptodome]'"
+        )
+    return _keccak(data)
 
 
 def pubkey_to_derived_address(pubkey_bytes: bytes) -> str:
@@ -61,6 +75,23 @@ class WalletAccount:
         return Wallet(pk)
 
 
+def _derive_child_account(master_key: Any, index: int) -> WalletAccount:
+    """Derive the WalletAccount at *index* below *master_key*."""
+    child = master_key.ChildKey(index)
+    priv_bytes = child.PrivateKey().Raw().ToBytes()
+    pub_bytes = child.PublicKey().RawUncompressed().ToBytes()
+    return WalletAccount(
+        private_key=priv_bytes,
+        public_key=pub_bytes,
+        address=pubkey_to_derived_address(pub_bytes),
+    )
+
+
+def _derive_child_account_from_xprv(xprv: str, index: int) -> WalletAccount:
+    """Process-pool entry point: rebuild the master key from its xprv, then derive."""
+    return _derive_child_account(Bip32Slip10Secp256k1.FromExtendedKey(xprv), index)
+
+
 class MnemonicWallet:
     """
     Wallet created from a BIP39 mnemonic with BIP32 derivation.
@@ -77,18 +108,38 @@ class MnemonicWallet:
         """Derive the account at the given index (same as server-side)."""
         if index in self._accounts:
             return self._accounts[index]
-        child = self._master_key.ChildKey(index)
-        priv_bytes = child.PrivateKey().Raw().ToBytes()
-        pub_bytes = child.PublicKey().RawUncompressed().ToBytes()
-        address = pubkey_to_derived_address(pub_bytes)
-        account = WalletAccount(
-            private_key=priv_bytes,
-            public_key=pub_bytes,
-            address=address,
-        )
+        account = _derive_child_account(self._master_key, index)
         self._accounts[index] = account
         return account
 
+    def derive_accounts(
+        self, indices: Iterable[int], max_workers: Optional[int] = None
+    ) -> dict[int, WalletAccount]:
+        """Derive several accounts at once; returns {index: WalletAccount}.
+
+        Large batches of not-yet-derived indices are spread over a process
+        pool (``max_workers`` defaults to ``os.cpu_count()``); small ones are
+        derived in-process. Results are cached like derive_account().
+        """
+        indices = list(dict.fromkeys(indices))
+        missing = [i for i in indices if i not in self._accounts]
+        workers = max_workers or os.cpu_count() or 1
+        if workers < 2 or len(missing) < _PARALLEL_DERIVE_MIN:
+            for index in missing:
+                self.derive_account(index)
+        else:
+            xprv = self._master_key.PrivateKey().ToExtended()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                accounts = pool.map(
+                    _derive_child_account_from_xprv,
+                    [xprv] * len(missing),
+                    missing,
+                    chunksize=max(1, len(missing) // (workers * 4)),
+                )
+                for index, account in zip(missing, accounts):
+                    self._accounts[index] = account
+        return {index: self._accounts[index] for index in indices}
+
     def get_account(self, index: int) -> WalletAccount:
         """Alias for derive_account."""
         return self.derive_account(index)
@@ -111,8 +162,7 @@ class MnemonicWallet:
             "mnemonic": self.mnemonic,
             "derivation_path": DERIVATION_PATH,
         }
-        serialized = json.dumps(payload, separators=(",", ":"))
-        encoded = base64.b64encode(serialized.encode("utf-8")).decode("ascii")
+        encoded = base64.b64encode(orjson.dumps(payload)).decode("ascii")
         path.write_text(encoded, encoding="utf-8")
 
 
@@ -126,8 +176,7 @@ def load_wallet(path: Union[str, Path]) -> MnemonicWallet:
     """
     path = Path(path)
     encoded = path.read_text(encoding="utf-8").strip()
-    serialized = base64.b64decode(encoded).decode("utf-8")
-    payload = json.loads(serialized)
+    payload = orjson.loads(base64.b64decode(encoded))
     if payload.get("version") != _STORED_WALLET_VERSION:
         raise ValueError(
             f"Unsupported stored wallet version: {payload.get('version')}; "
@@ -18,7 +18,7 @@ class TransactionStatus(str, Enum):
     FAILED = "Failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionHeader:
     """Immutable transaction header (except optional signature)."""
 
@@ -32,7 +32,7 @@ class TransactionHeader:
 
     def __post_init__(self) -> None:
         if self.creation_time == 0:
-            self.creation_time = int(current_time_millis())
+            self.creation_time = current_time_millis()
 
     def set_signature(self, signature: str) -> None:
         """Attach a hex-encoded signature to the header."""
@@ -43,14 +43,14 @@ class TransactionHeader:
         return bytes.fromhex(self.public_key)
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseTransaction:
     """Submission-ready transaction bundle: header + TTL."""
 
     header: TransactionHeader
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionResult:
     """Canonical result envelope returned by the chain for a submitted transaction."""
 
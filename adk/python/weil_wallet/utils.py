@@ -3,21 +3,23 @@
 - hash_sha256: SHA-256 over a byte slice
 - get_address_from_public_key: derive address (hex SHA-256 of compressed secp256k1 pubkey)
 - current_time_millis: Unix epoch time in milliseconds
-- compress: JSON-serialize a value and GZIP-compress it
+- compress: JSON-serialize a value (or take raw bytes) and GZIP-compress it
 """
 
 import hashlib
 import gzip
-import json
 import time
 from typing import Any
 
+import orjson
 from coincurve import PublicKey as Secp256k1PublicKey
 
+_sha256 = hashlib.sha256
+
 
 def hash_sha256(buf: bytes) -> bytes:
     """Compute the SHA-256 digest of buf. Returns 32 bytes."""
-    return hashlib.sha256(buf).digest()
+    return _sha256(buf).digest()
 
 
 def get_address_from_public_key(public_key: Secp256k1PublicKey) -> str:
@@ -27,25 +29,33 @@ def get_address_from_public_key(public_key: Secp256k1PublicKey) -> str:
     bytes, matching the Rust SDK (libsecp256k1 PublicKey::serialize() returns
     FULL_PUBLIC_KEY_SIZE, 65 bytes).
     """
-    full = public_key.format(compressed=False)
-    addr = hash_sha256(full)
-    return addr.hex()
+    return _sha256(public_key.format(compressed=False)).hexdigest()
+
+
+def current_time_millis() -> int:
+    """Return current Unix time in whole milliseconds."""
+    return time.time_ns() // 1_000_000
 
 
-def current_time_millis() -> float:
-    """Return current Unix time in milliseconds as float."""
-    return time.time() * 1000.0
+# Alias kept for existing callers; both return integer milliseconds.
+timestamp = current_time_millis
 
 
-def timestamp() -> int:
-    """Return current Unix time in milliseconds as integer."""
-    return int(current_time_millis())
+# Transaction bodies are a few hundred bytes of JSON; level 1 is several times
+# cheaper than the default level 9 and loses almost nothing on inputs that small.
+DEFAULT_COMPRESS_LEVEL = 1
 
 
-def compress(value: Any) -> bytes:
-    """Serialize value to JSON and GZIP-compress the bytes."""
-    json_str = json.dumps(value, separators=(",", ":"))
-    return gzip.compress(json_str.encode("utf-8"))
+def compress(value: Any, level: int = DEFAULT_COMPRESS_LEVEL) -> bytes:
+    """GZIP-compress value at *level*.
+
+    ``bytes`` are compressed as-is; anything else is serialized to compact JSON first.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = value
+    else:
+        data = orjson.dumps(value)
+    return gzip.compress(data, compresslevel=level, mtime=0)
 
 
 def value_to_sorted_dict(value: Any) -> dict[str, Any]:
@@ -12,17 +12,21 @@ This module supports multi-account wallets backed by secp256k1 keys.
 Signing uses secp256k1 ECDSA over the SHA-256 digest of the input.
 """
 
+import functools
 import hashlib
 import hmac as _hmac
-import json
 import struct
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Union
+from typing import Iterable, Literal, Union
 
+import orjson
 from coincurve import PrivateKey as Secp256k1PrivateKey, PublicKey as Secp256k1PublicKey
 
-from .utils import hash_sha256
+from .utils import get_address_from_public_key
+
+# Bound once so the sign path calls hashlib directly, without a wrapper call.
+_sha256 = hashlib.sha256
 
 
 class PrivateKey:
@@ -32,15 +36,28 @@ class PrivateKey:
     for the same on-chain identity.
     """
 
-    __slots__ = ("_hex",)
+    __slots__ = ("_raw", "_hex_str")
 
     def __init__(self, hex_str: str) -> None:
         hex_trimmed = hex_str.strip()
         if not hex_trimmed:
             raise ValueError("private key is empty")
-        if len(hex_trimmed) % 2 != 0 or not all(c in "0123456789abcdefABCDEF" for c in hex_trimmed):
+        try:
+            raw = bytes.fromhex(hex_trimmed)
+        except ValueError:
+            raise ValueError("private key is not a valid hexadecimal string") from None
+        # fromhex skips whitespace between byte pairs; a valid key has none.
+        if len(raw) * 2 != len(hex_trimmed):
             raise ValueError("private key is not a valid hexadecimal string")
-        self._hex = hex_trimmed
+        self._raw = raw
+        self._hex_str: str | None = hex_trimmed
+
+    @property
+    def _hex(self) -> str:
+        """Hex form of the key; keys built from raw bytes encode it on first use."""
+        if self._hex_str is None:
+            self._hex_str = self._raw.hex()
+        return self._hex_str
 
     @classmethod
     def from_file(cls, path: Union[str, Path]) -> "PrivateKey":
@@ -59,7 +76,12 @@ class PrivateKey:
     @classmethod
     def from_bytes(cls, key_bytes: bytes) -> "PrivateKey":
         """Create from raw private key bytes (e.g. from BIP32 derivation)."""
-        return cls(key_bytes.hex())
+        if not key_bytes:
+            raise ValueError("private key is empty")
+        key = cls.__new__(cls)
+        key._raw = bytes(key_bytes)
+        key._hex_str = None
+        return key
 
 
 class Wallet:
@@ -86,10 +108,27 @@ class Wallet:
         """Return the currently selected account's secp256k1 public key."""
         return self._current_account().public_key
 
+    def public_key_bytes(self, compressed: bool = True) -> bytes:
+        """Return the selected account's SEC1-encoded public key (cached per account)."""
+        account = self._current_account()
+        return account.public_key_compressed if compressed else account.public_key_uncompressed
+
+    def get_public_key_hex(self) -> str:
+        """Return the selected account's uncompressed public key as hex (computed once)."""
+        return self._current_account().public_key_hex
+
     def get_address(self) -> str:
         """Return the currently selected account's sentinel-minted address."""
         return self._current_account().account_address
 
+    def get_key_address(self) -> str:
+        """Return the hex SHA-256 address of the selected account's public key.
+
+        This is the address carried in auth headers (see
+        ``get_address_from_public_key``); it is computed once per account.
+        """
+        return self._current_account().key_address
+
     @classmethod
     def from_account_export_file(cls, path: Union[str, Path]) -> "Wallet":
         account = account_from_export_file(path)
@@ -114,7 +153,7 @@ class Wallet:
             ValueError: If the file type is not 'wallet' or contains no accounts.
             IndexError: If the selected_account index is out of bounds.
         """
-        data = json.loads(Path(path).read_text())
+        data = orjson.loads(Path(path).read_bytes())
         if data.get("type") != "wallet":
             raise ValueError(f"expected file type 'wallet', got '{data.get('type')}'")
 
@@ -135,12 +174,16 @@ class Wallet:
             child_key, _ = _bip32_derive_child(
                 account_key, account_chain, int(entry["index"]), hardened=False
             )
-            derived_accounts.append(Account(child_key, entry["account_address"]))
+            derived_accounts.append(
+                Account(Secp256k1PrivateKey(child_key), entry["account_address"])
+            )
 
         added_accounts: list[Account] = []
         for entry in external_entries:
             sk_bytes = bytes.fromhex(entry["secret_key"])
-            added_accounts.append(Account(sk_bytes, entry["account_address"]))
+            added_accounts.append(
+                Account(Secp256k1PrivateKey(sk_bytes), entry["account_address"])
+            )
 
         sel = data.get("selected_account", {"type": "derived", "index": 0}) or {}
         kind = sel.get("type", "derived")
@@ -196,11 +239,41 @@ class Wallet:
         The message is hashed with SHA-256, then signed. Returns hex-encoded
         64-byte compact signature (r || s), matching the Rust libsecp256k1 format.
         """
-        digest = hash_sha256(buf)
-        # coincurve returns DER; Rust uses compact 64-byte (r||s)
-        der_signature = self._current_account().secret_key.sign(digest, hasher=None)
-        compact = _der_signature_to_compact(der_signature)
-        return compact.hex()
+        digest = _sha256(buf).digest()
+        # libsecp256k1 serializes the recoverable form as compact r || s || v,
+        # with the same deterministic (RFC 6979, low-s) r and s as sign(); the
+        # first 64 bytes are the Rust format without a DER round-trip.
+        secret_key = self._current_account().secret_key
+        return secret_key.sign_recoverable(digest, hasher=None)[:64].hex()
+
+    def sign_prehashed(self, digest: bytes) -> str:
+        """Sign a 32-byte SHA-256 digest the caller already computed.
+
+        sign_prehashed(hash_sha256(buf)) == sign(buf). Raises ValueError if
+        digest is not exactly 32 bytes.
+        """
+        if len(digest) != 32:
+            raise ValueError(f"digest must be 32 bytes, got {len(digest)}")
+        secret_key = self._current_account().secret_key
+        return secret_key.sign_recoverable(digest, hasher=None)[:64].hex()
+
+    def sign_many(self, bufs: Iterable[bytes]) -> list[str]:
+        """Sign each buffer like sign(), with the selected account resolved once.
+
+        Returns the hex-encoded 64-byte compact signatures in input order.
+        """
+        sign = self._current_account().secret_key.sign_recoverable
+        return [sign(_sha256(buf).digest(), hasher=None)[:64].hex() for buf in bufs]
+
+    def sign_recoverable(self, buf: bytes) -> str:
+        """Sign buf like sign(), but append the recovery id.
+
+        Returns hex-encoded 65-byte signature (r || s || v). Verifiers that
+        know v recover the signer's public key in one step instead of trying
+        each candidate recovery id.
+        """
+        digest = _sha256(buf).digest()
+        return self._current_account().secret_key.sign_recoverable(digest, hasher=None).hex()
 
     def _current_account(self) -> "Account":
         sel = self._current_account_index
@@ -220,27 +293,48 @@ class SelectedAccount:
 @dataclass
 class Account:
     secret_key: Secp256k1PrivateKey
-    public_key: Secp256k1PublicKey
     account_address: str
 
+    @functools.cached_property
+    def public_key(self) -> Secp256k1PublicKey:
+        """Public key, derived on first use (sign-only accounts never need it)."""
+        return self.secret_key.public_key
+
+    @functools.cached_property
+    def key_address(self) -> str:
+        """Hex SHA-256 of the uncompressed public key, derived on first use."""
+        return get_address_from_public_key(self.public_key)
+
+    @functools.cached_property
+    def public_key_compressed(self) -> bytes:
+        """Compressed (33-byte) SEC1 encoding of the public key, computed once."""
+        return self.public_key.format(compressed=True)
+
+    @functools.cached_property
+    def public_key_uncompressed(self) -> bytes:
+        """Uncompressed (65-byte) SEC1 encoding of the public key, computed once."""
+        return self.public_key.format(compressed=False)
+
+    @functools.cached_property
+    def public_key_hex(self) -> str:
+        """Hex of the uncompressed (65-byte) public key, as sent on the wire."""
+        return self.public_key_uncompressed.hex()
+
     @classmethod
     def from_private_key_and_address(
         cls, key: PrivateKey, account_address: str | None
     ) -> "Account":
-        secret_key_bytes = bytes.fromhex(key._hex)
-        secret = Secp256k1PrivateKey(secret_key_bytes)
-        pub = secret.public_key
+        secret = Secp256k1PrivateKey(key._raw)
         if not account_address:
             # Fallback for backwards compatibility, but sentinel-minted addresses
             # should be provided via export files.
             account_address = ""
-        return cls(secret_key=secret, public_key=pub, account_address=account_address)
+        return cls(secret_key=secret, account_address=account_address)
 
 
 def account_from_export_file(path: Union[str, Path]) -> Account:
     path = Path(path)
-    raw = path.read_text(encoding="utf-8")
-    data = json.loads(raw)
+    data = orjson.loads(path.read_bytes())
     if data.get("type") != "account":
         raise ValueError(f"expected export type 'account', got '{data.get('type')}'")
     account = data.get("account") or {}
@@ -307,57 +401,3 @@ def _resolve_account_level_key(
     for idx, hardened in [(44, True), (9345, True), (0, True), (0, False)]:
         key, chain = _bip32_derive_child(key, chain, idx, hardened=hardened)
     return key, chain
-
-
-def _der_signature_to_compact(der: bytes) -> bytes:
-    """Convert DER-encoded ECDSA signature to 64-byte compact (r||s)."""
-    if len(der) < 8:
-        raise ValueError("invalid DER signature length")
-    # DER: 0x30 [total] 0x02 [r_len] [r...] 0x02 [s_len] [s...]
-    if der[0] != 0x30:
-        raise ValueError("DER signature must start with 0x30")
-
-    # Parse the outer length field (short or long form)
-    if der[1] == 0x80:
-        raise ValueError("indefinite length DER not supported")
-    if der[1] < 128:
-        i = 2
-    else:
-        num_len_bytes = der[1] & 0x7F
-        if 2 + num_len_bytes > len(der):
-            raise ValueError("DER signature too short for length encoding")
-        i = 2 + num_len_bytes
-
-    # Parse r
-    if i + 1 >= len(der):
-        raise ValueError("DER signature truncated before r tag")
-    if der[i] != 0x02:
-        raise ValueError("expected 0x02 tag for r component")
-    r_len = der[i + 1]
-    if i + 2 + r_len > len(der):
-        raise ValueError("DER signature truncated in r component")
-    r = der[i + 2 : i + 2 + r_len]
-    i += 2 + r_len
-
-    # Parse s
-    if i + 1 >= len(der):
-        raise ValueError("DER signature truncated before s tag")
-    if der[i] != 0x02:
-        raise ValueError("expected 0x02 tag for s component")
-    s_len = der[i + 1]
-    if i + 2 + s_len > len(der):
-        raise ValueError("DER signature truncated in s component")
-    s = der[i + 2 : i + 2 + s_len]
-
-    # DER encodes positive integers with a leading 0x00 when the high bit is set.
-    # Strip that padding byte before converting to the 32-byte compact form.
-    if len(r) == 33 and r[0] == 0x00:
-        r = r[1:]
-    if len(s) == 33 and s[0] == 0x00:
-        s = s[1:]
-    if len(r) > 32:
-        raise ValueError(f"r component is {len(r)} bytes, expected <= 32")
-    if len(s) > 32:
-        raise ValueError(f"s component is {len(s)} bytes, expected <= 32")
-
-    return r.rjust(32, b"\x00") + s.rjust(32, b"\x00")